@@ -0,0 +1,82 @@
+/**
+ * SSM 批量获取测试
+ */
+
+import { jest } from '@jest/globals';
+import { SSMClient, GetParametersCommand } from '@aws-sdk/client-ssm';
+import { getParameters } from '../../../utils/aws/ssm.js';
+import { AWSError } from '../../../utils/error.js';
+import { createMockParameter } from '../../helpers.js';
+
+describe('utils/aws/ssm - getParameters', () => {
+  let sendSpy: any;
+
+  beforeEach(() => {
+    sendSpy = jest.spyOn(SSMClient.prototype, 'send');
+  });
+
+  afterEach(() => {
+    sendSpy.mockRestore();
+  });
+
+  /**
+   * 模拟 GetParameters：只返回 existing 中存在的参数
+   */
+  function mockExisting(existing: Record<string, string>) {
+    sendSpy.mockImplementation(async (command: GetParametersCommand) => ({
+      Parameters: (command.input.Names || [])
+        .filter((name) => name in existing)
+        .map((name) => createMockParameter(name, existing[name] || '', 'SecureString')),
+      InvalidParameters: (command.input.Names || []).filter((name) => !(name in existing)),
+    }));
+  }
+
+  it('should return a map of found parameters and omit missing ones', async () => {
+    mockExisting({ '/a': '1', '/c': '3' });
+
+    const values = await getParameters(['/a', '/b', '/c']);
+
+    expect(values).toEqual(
+      new Map([
+        ['/a', '1'],
+        ['/c', '3'],
+      ])
+    );
+  });
+
+  it('should request names in chunks of 10', async () => {
+    const names = Array.from({ length: 23 }, (_, i) => `/param/${i}`);
+    mockExisting(Object.fromEntries(names.map((name) => [name, name])));
+
+    const values = await getParameters(names);
+
+    expect(sendSpy).toHaveBeenCalledTimes(3);
+    const chunks = sendSpy.mock.calls.map(
+      ([command]: [GetParametersCommand]) => command.input.Names
+    );
+    expect(chunks).toEqual([names.slice(0, 10), names.slice(10, 20), names.slice(20)]);
+    expect(values.size).toBe(23);
+  });
+
+  it('should pass the decrypt flag', async () => {
+    mockExisting({});
+
+    await getParameters(['/a'], false);
+
+    const [command] = sendSpy.mock.calls[0] as [GetParametersCommand];
+    expect(command.input.WithDecryption).toBe(false);
+  });
+
+  it('should not call SSM for an empty list', async () => {
+    const values = await getParameters([]);
+
+    expect(sendSpy).not.toHaveBeenCalled();
+    expect(values.size).toBe(0);
+  });
+
+  it('should wrap request failures in AWSError', async () => {
+    sendSpy.mockRejectedValue(new Error('AccessDeniedException'));
+
+    await expect(getParameters(['/a'])).rejects.toBeInstanceOf(AWSError);
+  });
+});
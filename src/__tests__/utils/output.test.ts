@@ -8,6 +8,7 @@ import {
   outputSuccess,
   outputError,
   maskSensitive,
+  truncate,
 } from '../../utils/output.js';
 
 describe('utils/output', () => {
@@ -170,6 +171,18 @@ describe('utils/output', () => {
     });
   });
 
+  describe('truncate', () => {
+    it('should keep short text unchanged', () => {
+      expect(truncate('short', 10)).toBe('short');
+      expect(truncate('exactly10!', 10)).toBe('exactly10!');
+    });
+
+    it('should truncate long text with ellipsis', () => {
+      expect(truncate('a'.repeat(70))).toBe('a'.repeat(60) + '...');
+      expect(truncate('SELECT * FROM users', 6)).toBe('SELECT...');
+    });
+  });
+
   describe('Output formatting consistency', () => {
     it('should produce valid JSON for success', () => {
       const data = { key: 'value' };
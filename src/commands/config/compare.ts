@@ -33,11 +33,18 @@ interface CompareResult {
   details: ParameterComparison[];
 }
 
+const VALID_ENVS: ReadonlySet<Environment> = new Set<Environment>([
+  'production',
+  'stage',
+  'development',
+]);
+
 export const compareCommand = new Command('compare')
   .description('对比两个环境的配置差异')
   .argument('<service>', '服务名称 (user-auth, mcp-host, commerce-backend, agentic-chat)')
   .requiredOption('--from-env <env>', '源环境 (production/stage/development)')
   .requiredOption('--to-env <env>', '目标环境 (production/stage/development)')
+  .option('--summary-only', '只输出各类差异的数量，不逐项列出参数')
   .option('--json', 'JSON 格式输出')
   .action(async (service, options) => {
     try {
@@ -45,8 +52,7 @@ export const compareCommand = new Command('compare')
       const toEnv = options.toEnv as Environment;
 
       // 验证环境
-      const validEnvs: Environment[] = ['production', 'stage', 'development'];
-      if (!validEnvs.includes(fromEnv) || !validEnvs.includes(toEnv)) {
+      if (!VALID_ENVS.has(fromEnv) || !VALID_ENVS.has(toEnv)) {
         throw new Error('无效的环境。可用环境: production, stage, development');
       }
 
@@ -109,36 +115,29 @@ export const compareCommand = new Command('compare')
         result.total_from = fromMap.size;
         result.total_to = toMap.size;
 
-        // 获取所有参数名称
-        const allNames = new Set([...fromMap.keys(), ...toMap.keys()]);
-
-        // 对比参数
-        for (const name of allNames) {
-          const fromParam = fromMap.get(name);
+        // 按键集合划分：共同键与只在源环境的键一次遍历完成，
+        // 每个键只查一次目标环境，不再先构造并集再双向查找
+        for (const [name, fromParam] of fromMap) {
           const toParam = toMap.get(name);
 
           const comparison: ParameterComparison = {
             name,
-            exists_in_from: !!fromParam,
+            exists_in_from: true,
             exists_in_to: !!toParam,
             values_match: false,
-            type_from: fromParam?.Type,
+            type_from: fromParam.Type,
             type_to: toParam?.Type,
           };
 
-          if (fromParam && !toParam) {
+          if (!toParam) {
             // 只在源环境存在
             result.only_in_from.push(name);
-          } else if (!fromParam && toParam) {
-            // 只在目标环境存在
-            result.only_in_to.push(name);
-          } else if (fromParam && toParam) {
+          } else {
             // 两个环境都存在
             if (fromParam.Value === toParam.Value) {
               comparison.values_match = true;
               result.identical.push(name);
             } else {
-              comparison.values_match = false;
               result.value_different.push(name);
             }
 
@@ -151,6 +150,20 @@ export const compareCommand = new Command('compare')
           result.details.push(comparison);
         }
 
+        // 只在目标环境存在
+        for (const [name, toParam] of toMap) {
+          if (fromMap.has(name)) continue;
+
+          result.only_in_to.push(name);
+          result.details.push({
+            name,
+            exists_in_from: false,
+            exists_in_to: true,
+            values_match: false,
+            type_to: toParam.Type,
+          });
+        }
+
         // 排序
         result.only_in_from.sort();
         result.only_in_to.sort();
@@ -160,7 +173,22 @@ export const compareCommand = new Command('compare')
 
         // 输出结果
         if (isJsonOutput()) {
-          outputSuccess(result);
+          if (options.summaryOnly) {
+            outputSuccess({
+              service,
+              from_env: fromEnv,
+              to_env: toEnv,
+              total_from: result.total_from,
+              total_to: result.total_to,
+              only_in_from: result.only_in_from.length,
+              only_in_to: result.only_in_to.length,
+              value_different: result.value_different.length,
+              type_different: result.type_different.length,
+              identical: result.identical.length,
+            });
+          } else {
+            outputSuccess(result);
+          }
         } else {
           // 摘要
           printSection('对比摘要');
@@ -168,56 +196,63 @@ export const compareCommand = new Command('compare')
           console.log(chalk.gray(`  ${toEnv}: ${result.total_to} 个参数`));
           console.log();
 
-          // 只在源环境
-          if (result.only_in_from.length > 0) {
-            printSection(`只在 ${fromEnv} 环境 (${result.only_in_from.length})`);
-            for (const name of result.only_in_from) {
-              console.log(chalk.red(`  - ${name}`));
-            }
+          if (options.summaryOnly) {
+            console.log(chalk.gray(`  只在 ${fromEnv}: ${result.only_in_from.length}`));
+            console.log(chalk.gray(`  只在 ${toEnv}: ${result.only_in_to.length}`));
+            console.log(chalk.gray(`  值不同: ${result.value_different.length}`));
+            console.log(chalk.gray(`  类型不同: ${result.type_different.length}`));
+            console.log(chalk.gray(`  完全相同: ${result.identical.length}`));
             console.log();
-          }
-
-          // 只在目标环境
-          if (result.only_in_to.length > 0) {
-            printSection(`只在 ${toEnv} 环境 (${result.only_in_to.length})`);
-            for (const name of result.only_in_to) {
-              console.log(chalk.green(`  + ${name}`));
+          } else {
+            // 只在源环境
+            if (result.only_in_from.length > 0) {
+              printSection(`只在 ${fromEnv} 环境 (${result.only_in_from.length})`);
+              for (const name of result.only_in_from) {
+                console.log(chalk.red(`  - ${name}`));
+              }
+              console.log();
             }
-            console.log();
-          }
 
-          // 值不同
-          if (result.value_different.length > 0) {
-            printSection(`值不同 (${result.value_different.length})`);
-            for (const name of result.value_different) {
-              console.log(chalk.yellow(`  ≠ ${name}`));
+            // 只在目标环境
+            if (result.only_in_to.length > 0) {
+              printSection(`只在 ${toEnv} 环境 (${result.only_in_to.length})`);
+              for (const name of result.only_in_to) {
+                console.log(chalk.green(`  + ${name}`));
+              }
+              console.log();
             }
-            console.log();
-          }
 
-          // 类型不同
-          if (result.type_different.length > 0) {
-            printSection(`类型不同 (${result.type_different.length})`);
-            for (const name of result.type_different) {
-              const detail = result.details.find(d => d.name === name);
-              if (detail) {
-                console.log(chalk.yellow(`  ⚠ ${name}: ${detail.type_from} → ${detail.type_to}`));
+            // 值不同
+            if (result.value_different.length > 0) {
+              printSection(`值不同 (${result.value_different.length})`);
+              for (const name of result.value_different) {
+                console.log(chalk.yellow(`  ≠ ${name}`));
               }
+              console.log();
             }
-            console.log();
-          }
 
-          // 完全相同
-          if (result.identical.length > 0) {
-            printSection(`完全相同 (${result.identical.length})`);
-            const maxShow = 10;
-            for (const name of result.identical.slice(0, maxShow)) {
-              console.log(chalk.gray(`  ✓ ${name}`));
+            // 类型不同
+            if (result.type_different.length > 0) {
+              printSection(`类型不同 (${result.type_different.length})`);
+              // 类型不同的键必然同时存在于两侧，直接按键查映射，避免对 details 线性查找
+              for (const name of result.type_different) {
+                console.log(chalk.yellow(`  ⚠ ${name}: ${fromMap.get(name).Type} → ${toMap.get(name).Type}`));
+              }
+              console.log();
             }
-            if (result.identical.length > maxShow) {
-              console.log(chalk.gray(`  ... 还有 ${result.identical.length - maxShow} 个相同参数`));
+
+            // 完全相同
+            if (result.identical.length > 0) {
+              printSection(`完全相同 (${result.identical.length})`);
+              const maxShow = 10;
+              for (const name of result.identical.slice(0, maxShow)) {
+                console.log(chalk.gray(`  ✓ ${name}`));
+              }
+              if (result.identical.length > maxShow) {
+                console.log(chalk.gray(`  ... 还有 ${result.identical.length - maxShow} 个相同参数`));
+              }
+              console.log();
             }
-            console.log();
           }
 
           // 总结
@@ -228,11 +263,13 @@ export const compareCommand = new Command('compare')
             console.log(chalk.yellow.bold(`⚠️  发现 ${totalDiff} 处差异`));
           }
 
-          console.log();
-          console.log(chalk.gray('💡 提示:'));
-          console.log(chalk.gray('  - 使用 config show <service> --env <env> 查看详细配置'));
-          console.log(chalk.gray('  - 使用 config get <service> <param> --env <env> 查看具体参数值'));
-          console.log(chalk.gray('  - 值差异不会显示具体内容，需要单独查看'));
+          if (!options.summaryOnly) {
+            console.log();
+            console.log(chalk.gray('💡 提示:'));
+            console.log(chalk.gray('  - 使用 config show <service> --env <env> 查看详细配置'));
+            console.log(chalk.gray('  - 使用 config get <service> <param> --env <env> 查看具体参数值'));
+            console.log(chalk.gray('  - 值差异不会显示具体内容，需要单独查看'));
+          }
         }
       } catch (error: any) {
         throw new Error(`配置对比失败: ${error.message}`);
@@ -4,7 +4,7 @@ import { join, dirname } from 'path';
 import { fileURLToPath } from 'url';
 import chalk from 'chalk';
 import ora from 'ora';
-import { getParameter } from '../../utils/aws/ssm.js';
+import { getParameter, getParameters } from '../../utils/aws/ssm.js';
 import { handleError } from '../../utils/error.js';
 import { isJsonOutput, outputSuccess } from '../../utils/output.js';
 import { exec } from 'child_process';
@@ -21,6 +21,12 @@ const S3_BUCKET = 'optima-terraform-state-585891120210';
 const SHARED_STATE_KEY = 'shared/terraform.tfstate';
 const DB_MGMT_STATE_KEY = 'database-management/terraform.tfstate';
 
+// Terraform State 不可用时的 RDS 地址
+const FALLBACK_RDS_INFO = {
+  host: 'optima-prod-postgres.ctg866o0ehac.ap-southeast-1.rds.amazonaws.com',
+  port: 5432,
+};
+
 interface DatabaseCredential {
   user: string;
   password: string;
@@ -56,197 +62,178 @@ function extractPasswordFromUrl(url: string): string | null {
 }
 
 /**
- * 获取 Production 环境密码
+ * 获取 RDS master 密码（从 Secrets Manager），Production 和 Stage 共用
  */
-async function fetchProductionPasswords(spinner: any): Promise<Record<string, DatabaseCredential>> {
-  spinner.text = '获取 Production 环境密码...';
-
-  const credentials: Record<string, DatabaseCredential> = {};
+async function fetchMasterPassword(): Promise<string | null> {
+  try {
+    const { stdout } = await execAsync(
+      `aws secretsmanager get-secret-value --secret-id /optima/rds/master-password --query SecretString --output text`
+    );
+    const secretData = JSON.parse(stdout.trim());
+    return secretData.password || null;
+  } catch {
+    return null;
+  }
+}
 
+/**
+ * 批量获取 SSM 参数值
+ *
+ * 批量请求整体失败时（如其中一个参数无权限、请求被限流）逐个重试，
+ * 单个参数失败只影响对应服务，失败的参数名通过 failed 返回
+ */
+async function fetchParameterValues(
+  names: string[]
+): Promise<{ values: Map<string, string>; failed: string[] }> {
   try {
-    // 获取各服务密码
-    const services = [
-      { key: 'optima_auth', param: '/optima/prod/user-auth/db-password', user: 'auth_user', db: 'optima_auth' },
-      { key: 'optima_mcp', param: '/optima/prod/mcp-host/db-password', user: 'mcp_user', db: 'optima_mcp' },
-      { key: 'optima_chat', param: '/optima/prod/agentic-chat/db-password', user: 'chat_user', db: 'optima_chat' },
-    ];
-
-    for (const service of services) {
-      try {
-        const param = await getParameter(service.param);
-        if (param?.Value) {
-          credentials[service.key] = {
-            user: service.user,
-            password: param.Value,
-            database: service.db,
-          };
-        }
-      } catch (error) {
-        // 如果单个服务获取失败，尝试从 database-url 获取
+    return { values: await getParameters(names), failed: [] };
+  } catch {
+    const values = new Map<string, string>();
+    const failed: string[] = [];
+
+    await Promise.all(
+      names.map(async (name) => {
         try {
-          const urlParam = await getParameter(service.param.replace('db-password', 'database-url'));
-          if (urlParam?.Value) {
-            const password = extractPasswordFromUrl(urlParam.Value);
-            if (password) {
-              credentials[service.key] = {
-                user: service.user,
-                password,
-                database: service.db,
-              };
-            }
+          const param = await getParameter(name);
+          if (param?.Value !== undefined) {
+            values.set(name, param.Value);
           }
         } catch {
-          // 忽略
+          failed.push(name);
         }
-      }
-    }
+      })
+    );
 
-    // commerce-backend 特殊处理（只有 database-url）
-    try {
-      const commerceUrl = await getParameter('/optima/prod/commerce-backend/database-url');
-      if (commerceUrl?.Value) {
-        const password = extractPasswordFromUrl(commerceUrl.Value);
-        if (password) {
-          credentials.optima_commerce = {
-            user: 'commerce_user',
-            password,
-            database: 'optima_commerce',
-          };
-        }
-      }
-    } catch {
-      // 忽略
-    }
+    return { values, failed };
+  }
+}
 
-    // 获取 master 密码（从 Secrets Manager）
-    try {
-      const { stdout } = await execAsync(
-        `aws secretsmanager get-secret-value --secret-id /optima/rds/master-password --query SecretString --output text`
-      );
-      const secretData = JSON.parse(stdout.trim());
-      const masterPass = secretData.password;
-
-      if (masterPass) {
-        credentials.optima_admin = {
-          user: 'optima_admin',
-          password: masterPass,
-          database: 'postgres',
-          note: 'Master password from AWS Secrets Manager - has access to all databases',
-        };
-      }
-    } catch (error) {
-      credentials.optima_admin = {
-        user: 'optima_admin',
-        password: 'PLEASE_SET_MASTER_PASSWORD',
-        database: 'postgres',
-        note: 'Master password from AWS Secrets Manager - has access to all databases',
+/**
+ * 获取 Production 环境密码
+ *
+ * 不直接操作 spinner（与其他来源并发执行），获取失败的 SSM 参数名通过 failedParams 返回
+ */
+async function fetchProductionPasswords(
+  masterPassword: string | null
+): Promise<{ credentials: Record<string, DatabaseCredential>; failedParams: string[] }> {
+  const credentials: Record<string, DatabaseCredential> = {};
+
+  // 获取各服务密码
+  const services = [
+    { key: 'optima_auth', param: '/optima/prod/user-auth/db-password', user: 'auth_user', db: 'optima_auth' },
+    { key: 'optima_mcp', param: '/optima/prod/mcp-host/db-password', user: 'mcp_user', db: 'optima_mcp' },
+    { key: 'optima_chat', param: '/optima/prod/agentic-chat/db-password', user: 'chat_user', db: 'optima_chat' },
+  ];
+
+  const commerceUrlParam = '/optima/prod/commerce-backend/database-url';
+
+  // 所有服务的 db-password 与备用 database-url 通过 GetParameters 一次批量获取
+  const { values: params, failed: failedParams } = await fetchParameterValues([
+    ...services.flatMap(service => [
+      service.param,
+      service.param.replace('db-password', 'database-url'),
+    ]),
+    commerceUrlParam,
+  ]);
+
+  for (const service of services) {
+    // 优先使用 db-password，缺失时从 database-url 中提取
+    const urlValue = params.get(service.param.replace('db-password', 'database-url'));
+    const password = params.get(service.param) || (urlValue ? extractPasswordFromUrl(urlValue) : null);
+    if (password) {
+      credentials[service.key] = {
+        user: service.user,
+        password,
+        database: service.db,
       };
     }
+  }
 
-    spinner.succeed('Production 环境密码获取完成');
-    return credentials;
-  } catch (error: any) {
-    spinner.fail(`获取 Production 密码失败: ${error.message}`);
-    throw error;
+  // commerce-backend 特殊处理（只有 database-url）
+  const commerceUrl = params.get(commerceUrlParam);
+  if (commerceUrl) {
+    const password = extractPasswordFromUrl(commerceUrl);
+    if (password) {
+      credentials.optima_commerce = {
+        user: 'commerce_user',
+        password,
+        database: 'optima_commerce',
+      };
+    }
   }
+
+  // master 密码（从 Secrets Manager）
+  credentials.optima_admin = {
+    user: 'optima_admin',
+    password: masterPassword || 'PLEASE_SET_MASTER_PASSWORD',
+    database: 'postgres',
+    note: 'Master password from AWS Secrets Manager - has access to all databases',
+  };
+
+  return { credentials, failedParams };
 }
 
 /**
  * 获取 Stage 环境密码
  */
-async function fetchStagePasswords(spinner: any): Promise<Record<string, DatabaseCredential>> {
-  spinner.text = '获取 Stage 环境密码...';
-
-  try {
-    // 从 Terraform State 获取
-    const { stdout } = await execAsync(
-      `aws s3 cp s3://${S3_BUCKET}/${DB_MGMT_STATE_KEY} - | jq -c '.outputs.stage_database_credentials.value'`
-    );
-
-    const stageCreds = JSON.parse(stdout.trim());
+async function fetchStagePasswords(
+  masterPassword: string | null
+): Promise<Record<string, DatabaseCredential>> {
+  // 从 Terraform State 获取
+  const { stdout } = await execAsync(
+    `aws s3 cp s3://${S3_BUCKET}/${DB_MGMT_STATE_KEY} - | jq -c '.outputs.stage_database_credentials.value'`
+  );
+
+  const stageCreds = JSON.parse(stdout.trim());
+
+  if (!stageCreds) {
+    throw new Error('无法从 Terraform State 获取 Stage 凭证');
+  }
 
-    if (!stageCreds) {
-      throw new Error('无法从 Terraform State 获取 Stage 凭证');
-    }
+  const credentials: Record<string, DatabaseCredential> = {
+    optima_admin: {
+      user: 'optima_admin',
+      password: masterPassword || 'PLEASE_SET_MASTER_PASSWORD',
+      database: 'postgres',
+      note: 'Master password from terraform state - has access to all databases',
+    },
+  };
 
-    // 获取 master 密码（从 Secrets Manager）
-    let masterPass = 'PLEASE_SET_MASTER_PASSWORD';
-    try {
-      const { stdout: masterStdout } = await execAsync(
-        `aws secretsmanager get-secret-value --secret-id /optima/rds/master-password --query SecretString --output text`
-      );
-      const secretData = JSON.parse(masterStdout.trim());
-      if (secretData.password) {
-        masterPass = secretData.password;
-      }
-    } catch {
-      // 使用默认值
-    }
+  // 转换格式
+  const serviceMap: Record<string, string> = {
+    auth: 'optima_stage_auth',
+    mcp: 'optima_stage_mcp',
+    commerce: 'optima_stage_commerce',
+    chat: 'optima_stage_chat',
+    infisical: 'optima_infisical',
+  };
 
-    const credentials: Record<string, DatabaseCredential> = {
-      optima_admin: {
-        user: 'optima_admin',
-        password: masterPass,
-        database: 'postgres',
-        note: 'Master password from terraform state - has access to all databases',
-      },
-    };
-
-    // 转换格式
-    const serviceMap: Record<string, string> = {
-      auth: 'optima_stage_auth',
-      mcp: 'optima_stage_mcp',
-      commerce: 'optima_stage_commerce',
-      chat: 'optima_stage_chat',
-      infisical: 'optima_infisical',
-    };
-
-    for (const [key, dbKey] of Object.entries(serviceMap)) {
-      if (stageCreds[key]) {
-        credentials[dbKey] = {
-          user: stageCreds[key].db_user,
-          password: stageCreds[key].db_password,
-          database: stageCreds[key].db_name,
-        };
-      }
+  for (const [key, dbKey] of Object.entries(serviceMap)) {
+    if (stageCreds[key]) {
+      credentials[dbKey] = {
+        user: stageCreds[key].db_user,
+        password: stageCreds[key].db_password,
+        database: stageCreds[key].db_name,
+      };
     }
-
-    spinner.succeed('Stage 环境密码获取完成');
-    return credentials;
-  } catch (error: any) {
-    spinner.fail(`获取 Stage 密码失败: ${error.message}`);
-    throw error;
   }
+
+  return credentials;
 }
 
 /**
- * 获取 RDS 信息
+ * 获取 RDS 信息（从 Terraform State），获取失败返回 null
  */
-async function fetchRDSInfo(spinner: any): Promise<{ host: string; port: number }> {
-  spinner.text = '获取 RDS 连接信息...';
-
+async function fetchRDSInfo(): Promise<{ host: string; port: number } | null> {
   try {
     const { stdout } = await execAsync(
       `aws s3 cp s3://${S3_BUCKET}/${SHARED_STATE_KEY} - | jq -r '.outputs.rds_instance_address.value'`
     );
 
     const host = stdout.trim();
-
-    if (host && host !== 'null') {
-      spinner.succeed('RDS 连接信息获取完成');
-      return { host, port: 5432 };
-    }
-
-    // Fallback
-    return {
-      host: 'optima-prod-postgres.ctg866o0ehac.ap-southeast-1.rds.amazonaws.com',
-      port: 5432,
-    };
+    return host && host !== 'null' ? { host, port: 5432 } : null;
   } catch {
-    return {
-      host: 'optima-prod-postgres.ctg866o0ehac.ap-southeast-1.rds.amazonaws.com',
-      port: 5432,
-    };
+    return null;
   }
 }
 
@@ -336,13 +323,47 @@ export const initCredentialsCommand = new Command('init-credentials')
         process.exit(1);
       }
 
-      // 获取凭证
-      const prodCreds = await fetchProductionPasswords(spinner);
-      const stageCreds = await fetchStagePasswords(spinner);
-      const rdsInfo = await fetchRDSInfo(spinner);
+      // 获取凭证：三个来源（SSM、Terraform State、RDS）互不依赖，并发获取；
+      // master 密码两个环境相同，只获取一次
+      spinner.text = '获取数据库凭证...';
+      const masterPassword = fetchMasterPassword();
+      const [prodResult, stageResult, rdsResult] = await Promise.allSettled([
+        masterPassword.then((password) => fetchProductionPasswords(password)),
+        masterPassword.then((password) => fetchStagePasswords(password)),
+        fetchRDSInfo(),
+      ]);
+
+      // 全部完成后按固定顺序输出各来源结果
+      if (prodResult.status === 'fulfilled') {
+        spinner.succeed('Production 环境密码获取完成');
+        if (prodResult.value.failedParams.length > 0) {
+          spinner.warn(`部分 SSM 参数获取失败: ${prodResult.value.failedParams.join(', ')}`);
+        }
+      } else {
+        spinner.fail(`获取 Production 密码失败: ${prodResult.reason?.message}`);
+      }
+
+      if (stageResult.status === 'fulfilled') {
+        spinner.succeed('Stage 环境密码获取完成');
+      } else {
+        spinner.fail(`获取 Stage 密码失败: ${stageResult.reason?.message}`);
+      }
+
+      // fetchRDSInfo 不会 reject，失败时使用默认地址
+      let rdsInfo = FALLBACK_RDS_INFO;
+      if (rdsResult.status === 'fulfilled' && rdsResult.value) {
+        rdsInfo = rdsResult.value;
+        spinner.succeed('RDS 连接信息获取完成');
+      }
+
+      if (prodResult.status === 'rejected') throw prodResult.reason;
+      if (stageResult.status === 'rejected') throw stageResult.reason;
+
+      const prodCreds = prodResult.value.credentials;
+      const stageCreds = stageResult.value;
+      spinner.start('生成配置文件...');
 
       // 生成配置
-      spinner.text = '生成配置文件...';
       const config = await generateCredentialsFile(prodCreds, stageCreds, rdsInfo);
 
       // 写入文件
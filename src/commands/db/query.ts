@@ -4,7 +4,7 @@ import { getCurrentEnvironment, Environment } from '../../utils/config.js';
 import { DatabaseClient } from '../../db/client.js';
 import { getDatabasePassword } from '../../db/password.js';
 import { handleError } from '../../utils/error.js';
-import { isJsonOutput, outputSuccess, printTitle, createTable } from '../../utils/output.js';
+import { isJsonOutput, outputSuccess, printTitle, createTable, truncate } from '../../utils/output.js';
 import { selectPrompt } from '../../utils/prompt.js';
 
 export const queryCommand = new Command('query')
@@ -50,7 +50,7 @@ export const queryCommand = new Command('query')
 
       if (!isJsonOutput()) {
         printTitle(`📊 执行查询 - ${database}`);
-        console.log(chalk.gray(`查询: ${sql.substring(0, 100)}${sql.length > 100 ? '...' : ''}\\n`));
+        console.log(chalk.gray(`查询: ${truncate(sql, 100)}\\n`));
       }
 
       const password = await getDatabasePassword(env, database);
@@ -4,7 +4,7 @@ import { getCurrentEnvironment, Environment } from '../../utils/config.js';
 import { DatabaseClient } from '../../db/client.js';
 import { getDatabasePassword } from '../../db/password.js';
 import { handleError } from '../../utils/error.js';
-import { isJsonOutput, outputSuccess, printTitle, createTable } from '../../utils/output.js';
+import { isJsonOutput, outputSuccess, printTitle, createTable, truncate } from '../../utils/output.js';
 import { getSlowQueriesQuery } from '../../db/queries/health.js';
 
 export const slowQueriesCommand = new Command('slow-queries')
@@ -60,9 +60,7 @@ export const slowQueriesCommand = new Command('slow-queries')
                 ? `${duration.minutes}m ${duration.seconds}s`
                 : `${duration.seconds}s`;
 
-              const query = row.query || '';
-              const queryShort =
-                query.length > 60 ? query.substring(0, 60) + '...' : query;
+              const queryShort = truncate(row.query || '', 60);
 
               table.push([
                 row.pid.toString(),
@@ -12,6 +12,46 @@ import {
 } from '../../utils/output.js';
 import { handleError } from '../../utils/error.js';
 
+/**
+ * 获取单个服务的部署 workflow 及最近的 runs（失败时返回 { error }）
+ */
+async function fetchServiceDeployments(service: string, limit: number): Promise<any> {
+  try {
+    const repo = getServiceRepo(service);
+    const workflow = await getDeployWorkflow(repo);
+
+    if (!workflow) {
+      throw new Error('未找到 workflow');
+    }
+
+    const runs = await getWorkflowRuns(repo, {
+      workflow,
+      branch: 'main',
+      limit,
+    });
+
+    return {
+      repo,
+      workflow,
+      runs: runs.map(run => ({
+        id: run.id,
+        number: run.number,
+        status: run.status,
+        conclusion: run.conclusion,
+        branch: run.branch,
+        commit: run.commit,
+        started_at: run.startedAt,
+        updated_at: run.updatedAt,
+        url: run.url,
+      })),
+    };
+  } catch (error: any) {
+    return {
+      error: error.message,
+    };
+  }
+}
+
 export const listCommand = new Command('list')
   .description('列出所有服务的部署状态')
   .option('--env <env>', '环境 (production/stage/development)')
@@ -28,64 +68,36 @@ export const listCommand = new Command('list')
         printTitle(`📋 所有服务部署状态 - ${env} 环境`);
       }
 
+      // 每个服务的 workflow 解析与 run 查询整条链路并发执行，结果按服务顺序输出
+      const fetched = await Promise.all(
+        services.map(service => fetchServiceDeployments(service, limit))
+      );
+
       const results: any = {};
 
-      for (const service of services) {
+      services.forEach((service, i) => {
+        const serviceResult = fetched[i];
+        results[service] = serviceResult;
+
         if (!isJsonOutput()) {
           process.stdout.write(chalk.white(`\n${service}... `));
-        }
 
-        try {
-          const repo = getServiceRepo(service);
-          const workflow = await getDeployWorkflow(repo);
-
-          if (!workflow) {
-            throw new Error('未找到 workflow');
-          }
-
-          const runs = await getWorkflowRuns(repo, {
-            workflow,
-            branch: 'main',
-            limit,
-          });
-
-          results[service] = {
-            repo,
-            workflow,
-            runs: runs.map(run => ({
-              id: run.id,
-              number: run.number,
-              status: run.status,
-              conclusion: run.conclusion,
-              branch: run.branch,
-              commit: run.commit,
-              started_at: run.startedAt,
-              updated_at: run.updatedAt,
-              url: run.url,
-            })),
-          };
-
-          if (!isJsonOutput()) {
-            const latest = runs[0];
-            if (latest) {
-              const statusText = latest.conclusion
-                ? formatStatus(latest.conclusion)
-                : formatStatus(latest.status);
-              console.log(`${statusText} (${formatRelativeTime(latest.startedAt)})`);
-            } else {
-              console.log(chalk.gray('无部署记录'));
-            }
+          if (serviceResult.error) {
+            console.log(chalk.red(`错误: ${serviceResult.error}`));
+            return;
           }
-        } catch (error: any) {
-          results[service] = {
-            error: error.message,
-          };
 
-          if (!isJsonOutput()) {
-            console.log(chalk.red(`错误: ${error.message}`));
+          const latest = serviceResult.runs[0];
+          if (latest) {
+            const statusText = latest.conclusion
+              ? formatStatus(latest.conclusion)
+              : formatStatus(latest.status);
+            console.log(`${statusText} (${formatRelativeTime(latest.started_at)})`);
+          } else {
+            console.log(chalk.gray('无部署记录'));
           }
         }
-      }
+      });
 
       if (isJsonOutput()) {
         outputSuccess({
@@ -34,8 +34,163 @@ function getInfisicalEnvsDir(): string {
   );
 }
 
-function getSyncScript(): string {
-  return path.join(getInfisicalEnvsDir(), 'scripts/sync_to_infisical.py');
+/**
+ * 同步脚本路径（由调用方传入已解析的 infisical-envs 目录，避免重复查找）
+ */
+function getSyncScript(infisicalEnvsDir: string): string {
+  return path.join(infisicalEnvsDir, 'scripts/sync_to_infisical.py');
+}
+
+// ============== 目录扫描 ==============
+
+const ENV_FILE_SUFFIX = '.env';
+const SERVICES_PREFIX = '/services/';
+const SHARED_SECRETS_PREFIX = '/shared-secrets/';
+
+/**
+ * Infisical 环境名（.env 文件名 / shared-secrets 子目录名）
+ */
+const ENV_NAMES: ReadonlySet<string> = new Set(['common', 'prod', 'staging']);
+
+interface EnvFileEntry {
+  name: string;
+  path: string;
+  environments: string[];
+}
+
+/**
+ * 读取目录项，目录不存在时返回 null（代替 existsSync + readdirSync 两次系统调用）
+ *
+ * 仅 ENOENT 视为不存在，权限等其他错误照常抛出
+ */
+function readDirEntries(dir: string): fs.Dirent[] | null {
+  try {
+    return fs.readdirSync(dir, { withFileTypes: true });
+  } catch (error: any) {
+    if (error.code === 'ENOENT') {
+      return null;
+    }
+    throw error;
+  }
+}
+
+/**
+ * 判断目录项是否为目录（跟随符号链接，与 existsSync 行为一致）
+ */
+function isDirectoryEntry(dir: string, entry: fs.Dirent): boolean {
+  if (entry.isDirectory()) return true;
+  if (!entry.isSymbolicLink()) return false;
+
+  try {
+    return fs.statSync(path.join(dir, entry.name)).isDirectory();
+  } catch {
+    // 悬空链接
+    return false;
+  }
+}
+
+/**
+ * 递归遍历目录，对每个目录回调其中 .env 文件名（不含扩展名）
+ *
+ * 每个目录只 readdir 一次，文件与子目录在同一轮中分拣；隐藏目录跳过。
+ * 回调顺序取决于文件系统，需要稳定顺序时由调用方统一排序
+ */
+function walkEnvDirs(
+  dir: string,
+  basePath: string,
+  visit: (basePath: string, envNames: string[]) => void
+): void {
+  const envNames: string[] = [];
+  const subDirs: string[] = [];
+
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+    // 先按文件名（readdir 已返回）筛选，再判断类型
+    if (entry.name.endsWith(ENV_FILE_SUFFIX) && entry.isFile()) {
+      // 已确认后缀，直接按长度截掉（replace 会误删文件名中间的 ".env"）
+      envNames.push(entry.name.slice(0, -ENV_FILE_SUFFIX.length));
+    } else if (entry.isDirectory() && !entry.name.startsWith('.')) {
+      subDirs.push(entry.name);
+    }
+  }
+
+  visit(basePath, envNames);
+
+  for (const subDir of subDirs) {
+    walkEnvDirs(path.join(dir, subDir), `${basePath}/${subDir}`, visit);
+  }
+}
+
+/**
+ * 按 Infisical 路径排序（服务与共享密钥列表共用同一比较规则）
+ */
+function compareByPath(a: EnvFileEntry, b: EnvFileEntry): number {
+  return a.path.localeCompare(b.path);
+}
+
+/**
+ * 扫描 v2/services，一次遍历得到所有服务及其环境（按路径排序）
+ */
+function scanServices(servicesDir: string): EnvFileEntry[] {
+  const services: EnvFileEntry[] = [];
+
+  for (const serviceDir of fs.readdirSync(servicesDir, { withFileTypes: true })) {
+    if (!serviceDir.isDirectory()) continue;
+
+    walkEnvDirs(
+      path.join(servicesDir, serviceDir.name),
+      `/services/${serviceDir.name}`,
+      (basePath, envNames) => {
+        if (envNames.length === 0) return;
+        services.push({
+          name: basePath.slice(SERVICES_PREFIX.length),
+          path: basePath,
+          // 按 ENV_NAMES 的固定顺序输出，与共享密钥一致
+          environments: [...ENV_NAMES].filter((e) => envNames.includes(e)),
+        });
+      }
+    );
+  }
+
+  services.sort(compareByPath);
+  return services;
+}
+
+/**
+ * 扫描 v2/shared-secrets 下各环境目录，合并为按路径排序的密钥列表
+ */
+function scanSharedSecrets(sharedDir: string): EnvFileEntry[] {
+  const secrets: EnvFileEntry[] = [];
+  const secretsByPath = new Map<string, EnvFileEntry>();
+
+  // 扫描每个环境目录
+  for (const envName of ENV_NAMES) {
+    const envDir = path.join(sharedDir, envName);
+    if (!fs.existsSync(envDir)) continue;
+
+    walkEnvDirs(envDir, '/shared-secrets', (basePath, secretNames) => {
+      for (const secretName of secretNames) {
+        const secretPath = `${basePath}/${secretName}`;
+
+        // 查找或创建记录
+        let secret = secretsByPath.get(secretPath);
+        if (!secret) {
+          secret = {
+            name: secretPath.slice(SHARED_SECRETS_PREFIX.length),
+            path: secretPath,
+            environments: [],
+          };
+          secretsByPath.set(secretPath, secret);
+          secrets.push(secret);
+        }
+        secret.environments.push(envName);
+      }
+    });
+  }
+
+  // 按路径排序
+  secrets.sort(compareByPath);
+
+  return secrets;
 }
 
 // ============== sync ==============
@@ -50,7 +205,7 @@ const syncCommand = new Command('sync')
   .action(async (options) => {
     try {
       const infisicalEnvsDir = getInfisicalEnvsDir();
-      const syncScript = getSyncScript();
+      const syncScript = getSyncScript(infisicalEnvsDir);
 
       // 检查 Python 脚本是否存在
       if (!fs.existsSync(syncScript)) {
@@ -125,69 +280,29 @@ const listServicesCommand = new Command('list-services')
         throw new Error(`服务目录不存在: ${servicesDir}`);
       }
 
-      const services: Array<{
-        name: string;
-        path: string;
-        environments: string[];
-      }> = [];
-
-      // 递归扫描服务目录
-      function scanDir(dir: string, basePath: string) {
-        const entries = fs.readdirSync(dir, { withFileTypes: true });
-
-        const envFiles = entries.filter(
-          (e) => e.isFile() && e.name.endsWith('.env')
-        );
-
-        if (envFiles.length > 0) {
-          const environments = envFiles
-            .map((e) => e.name.replace('.env', ''))
-            .filter((e) => ['common', 'prod', 'staging'].includes(e));
-
-          services.push({
-            name: basePath.replace('/services/', ''),
-            path: basePath,
-            environments,
-          });
-        }
-
-        for (const entry of entries) {
-          if (entry.isDirectory() && !entry.name.startsWith('.')) {
-            scanDir(
-              path.join(dir, entry.name),
-              `${basePath}/${entry.name}`
-            );
-          }
-        }
-      }
-
-      const serviceDirs = fs.readdirSync(servicesDir, { withFileTypes: true });
-      for (const serviceDir of serviceDirs) {
-        if (serviceDir.isDirectory()) {
-          scanDir(
-            path.join(servicesDir, serviceDir.name),
-            `/services/${serviceDir.name}`
-          );
-        }
-      }
+      const services = scanServices(servicesDir);
 
       if (isJsonOutput()) {
         outputSuccess({ services });
       } else {
-        console.log(chalk.bold('\n可同步的服务列表\n'));
-        console.log(chalk.gray('─'.repeat(70)));
+        // 整张列表先拼好，一次写出
+        const lines = [
+          chalk.bold('\n可同步的服务列表\n'),
+          chalk.gray('─'.repeat(70)),
+        ];
 
         for (const svc of services) {
           const envs = svc.environments.join(', ');
-          console.log(
+          lines.push(
             `${chalk.cyan(svc.name.padEnd(30))} ` +
               `${chalk.gray(svc.path.padEnd(25))} ` +
               `[${envs}]`
           );
         }
 
-        console.log(chalk.gray('─'.repeat(70)));
-        console.log(`共 ${services.length} 个服务\n`);
+        lines.push(chalk.gray('─'.repeat(70)));
+        lines.push(`共 ${services.length} 个服务\n`);
+        console.log(lines.join('\n'));
       }
     } catch (error) {
       handleError(error);
@@ -208,68 +323,29 @@ const listSharedCommand = new Command('list-shared')
         throw new Error(`共享密钥目录不存在: ${sharedDir}`);
       }
 
-      const secrets: Array<{
-        name: string;
-        path: string;
-        environments: string[];
-      }> = [];
-
-      // 扫描每个环境目录
-      for (const envName of ['common', 'prod', 'staging']) {
-        const envDir = path.join(sharedDir, envName);
-        if (!fs.existsSync(envDir)) continue;
-
-        function scanEnvDir(dir: string, basePath: string) {
-          const entries = fs.readdirSync(dir, { withFileTypes: true });
-
-          for (const entry of entries) {
-            if (entry.isFile() && entry.name.endsWith('.env')) {
-              const secretName = entry.name.replace('.env', '');
-              const secretPath = `${basePath}/${secretName}`;
-
-              // 查找或创建记录
-              let secret = secrets.find((s) => s.path === secretPath);
-              if (!secret) {
-                secret = {
-                  name: secretPath.replace('/shared-secrets/', ''),
-                  path: secretPath,
-                  environments: [],
-                };
-                secrets.push(secret);
-              }
-              secret.environments.push(envName);
-            } else if (entry.isDirectory() && !entry.name.startsWith('.')) {
-              scanEnvDir(
-                path.join(dir, entry.name),
-                `${basePath}/${entry.name}`
-              );
-            }
-          }
-        }
-
-        scanEnvDir(envDir, '/shared-secrets');
-      }
-
-      // 按路径排序
-      secrets.sort((a, b) => a.path.localeCompare(b.path));
+      const secrets = scanSharedSecrets(sharedDir);
 
       if (isJsonOutput()) {
         outputSuccess({ secrets });
       } else {
-        console.log(chalk.bold('\n共享密钥配置列表\n'));
-        console.log(chalk.gray('─'.repeat(70)));
+        // 整张列表先拼好，一次写出
+        const lines = [
+          chalk.bold('\n共享密钥配置列表\n'),
+          chalk.gray('─'.repeat(70)),
+        ];
 
         for (const secret of secrets) {
           const envs = secret.environments.join(', ');
-          console.log(
+          lines.push(
             `${chalk.cyan(secret.name.padEnd(30))} ` +
               `${chalk.gray(secret.path.padEnd(30))} ` +
               `[${envs}]`
           );
         }
 
-        console.log(chalk.gray('─'.repeat(70)));
-        console.log(`共 ${secrets.length} 个配置\n`);
+        lines.push(chalk.gray('─'.repeat(70)));
+        lines.push(`共 ${secrets.length} 个配置\n`);
+        console.log(lines.join('\n'));
       }
     } catch (error) {
       handleError(error);
@@ -310,28 +386,28 @@ const statusCommand = new Command('status')
         );
       }
 
-      // 检查 v2 目录
+      // 检查 v2 目录（每个目录只 readdir 一次，用 Dirent 判断子目录是否存在）
       const v2Dir = path.join(infisicalEnvsDir, 'v2');
-      if (fs.existsSync(v2Dir)) {
+      const v2Entries = readDirEntries(v2Dir);
+      if (v2Entries) {
         console.log(chalk.green('✓') + ' v2 目录存在');
+        const v2SubDirs = new Set(
+          v2Entries.filter((e) => isDirectoryEntry(v2Dir, e)).map((e) => e.name)
+        );
 
         // 统计服务数量
-        const servicesDir = path.join(v2Dir, 'services');
-        if (fs.existsSync(servicesDir)) {
-          const serviceCount = fs
-            .readdirSync(servicesDir, { withFileTypes: true })
-            .filter((e) => e.isDirectory()).length;
+        if (v2SubDirs.has('services')) {
+          const servicesDir = path.join(v2Dir, 'services');
+          const serviceCount = (readDirEntries(servicesDir) || [])
+            .filter((e) => isDirectoryEntry(servicesDir, e)).length;
           console.log(chalk.gray(`  服务目录: ${serviceCount} 个`));
         }
 
         // 统计共享密钥数量
-        const sharedDir = path.join(v2Dir, 'shared-secrets');
-        if (fs.existsSync(sharedDir)) {
-          let envCount = 0;
-          for (const env of ['common', 'prod', 'staging']) {
-            const envDir = path.join(sharedDir, env);
-            if (fs.existsSync(envDir)) envCount++;
-          }
+        if (v2SubDirs.has('shared-secrets')) {
+          const sharedDir = path.join(v2Dir, 'shared-secrets');
+          const envCount = (readDirEntries(sharedDir) || [])
+            .filter((e) => ENV_NAMES.has(e.name) && isDirectoryEntry(sharedDir, e)).length;
           console.log(chalk.gray(`  共享密钥环境: ${envCount} 个`));
         }
       } else {
@@ -339,7 +415,7 @@ const statusCommand = new Command('status')
       }
 
       // 检查 Python 脚本
-      const syncScript = getSyncScript();
+      const syncScript = getSyncScript(infisicalEnvsDir);
       if (fs.existsSync(syncScript)) {
         console.log(chalk.green('✓') + ' 同步脚本可用');
       } else {
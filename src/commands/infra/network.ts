@@ -73,6 +73,7 @@ export const networkCommand = new Command('network')
         // 获取主机网络接口
         const ipResult = await ssh.executeCommand('ip -o addr show');
         const ipLines = ipResult.stdout.trim().split('\n');
+        const interfaceMap = new Map<string, NetworkInterface>();
 
         for (const line of ipLines) {
           const parts = line.trim().split(/\s+/);
@@ -85,12 +86,13 @@ export const networkCommand = new Command('network')
             if (ifName === 'lo') continue;
 
             // 查找或创建接口记录
-            let iface = result.interfaces.find(i => i.name === ifName);
+            let iface = interfaceMap.get(ifName);
             if (!iface) {
               iface = {
                 name: ifName,
                 state: 'unknown',
               };
+              interfaceMap.set(ifName, iface);
               result.interfaces.push(iface);
             }
 
@@ -103,65 +105,77 @@ export const networkCommand = new Command('network')
           }
         }
 
-        // 获取接口状态和 MTU
-        for (const iface of result.interfaces) {
-          try {
-            const ifaceInfo = await ssh.executeCommand(`ip link show ${iface.name}`);
-            const match = ifaceInfo.stdout.match(/state (\S+)/);
+        // 获取接口状态和 MTU（一次 ip -o link show 取回全部接口，每行一个接口）
+        try {
+          const linkResult = await ssh.executeCommand('ip -o link show');
+          for (const line of linkResult.stdout.trim().split('\n')) {
+            // 格式: "2: eth0: <...> mtu 9001 ... state UP ..." (veth 接口名带 @ifN 后缀)
+            const nameMatch = line.match(/^\d+:\s+([^:@\s]+)/);
+            const iface = nameMatch && nameMatch[1] ? interfaceMap.get(nameMatch[1]) : undefined;
+            if (!iface) continue;
+
+            const match = line.match(/state (\S+)/);
             if (match && match[1]) {
               iface.state = match[1];
             }
-            const mtuMatch = ifaceInfo.stdout.match(/mtu (\d+)/);
+            const mtuMatch = line.match(/mtu (\d+)/);
             if (mtuMatch && mtuMatch[1]) {
               iface.mtu = mtuMatch[1];
             }
-            const macMatch = ifaceInfo.stdout.match(/link\/ether ([0-9a-f:]+)/);
+            const macMatch = line.match(/link\/ether ([0-9a-f:]+)/);
             if (macMatch && macMatch[1]) {
               iface.mac = macMatch[1];
             }
-          } catch (error) {
-            // 忽略单个接口错误
           }
+        } catch (error) {
+          // 接口状态获取失败，保留地址信息
         }
 
         // 获取 Docker 网络信息
         const dockerNetworksResult = await ssh.executeCommand(
           'docker network ls --format "{{.Name}}\t{{.Driver}}\t{{.Scope}}"'
         );
-        const networkLines = dockerNetworksResult.stdout.trim().split('\n');
-
-        for (const line of networkLines) {
-          const parts = line.split('\t');
-          if (parts.length >= 3 && parts[0] && parts[1] && parts[2]) {
-            const networkName = parts[0];
-
-            // 获取网络详细信息
-            try {
-              const inspectResult = await ssh.executeCommand(`docker network inspect ${networkName}`);
-              const networkData = JSON.parse(inspectResult.stdout)[0];
-
-              const subnet = networkData.IPAM?.Config?.[0]?.Subnet;
-              const gateway = networkData.IPAM?.Config?.[0]?.Gateway;
-              const containers = Object.keys(networkData.Containers || {}).length;
-
-              result.docker_networks.push({
-                name: networkName,
-                driver: parts[1],
-                scope: parts[2],
-                subnet,
-                gateway,
-                containers,
-                created: networkData.Created,
-              });
-            } catch (error) {
-              // 网络详情获取失败，使用基本信息
-              result.docker_networks.push({
-                name: networkName,
-                driver: parts[1],
-                scope: parts[2],
-                containers: 0,
-              });
+        const networkRows = dockerNetworksResult.stdout
+          .trim()
+          .split('\n')
+          .map(line => line.split('\t'))
+          .filter(parts => parts.length >= 3 && parts[0] && parts[1] && parts[2]);
+
+        // 一次 docker network inspect 取回所有网络详情，按名称索引
+        const networkDetails = new Map<string, any>();
+        if (networkRows.length > 0) {
+          try {
+            const names = networkRows.map(parts => parts[0]).join(' ');
+            const inspectResult = await ssh.executeCommand(`docker network inspect ${names}`);
+            for (const networkData of JSON.parse(inspectResult.stdout)) {
+              networkDetails.set(networkData.Name, networkData);
             }
+          } catch (error) {
+            // 网络详情获取失败，使用基本信息
+          }
+        }
+
+        for (const parts of networkRows) {
+          const networkName = parts[0] || '';
+          const networkData = networkDetails.get(networkName);
+
+          if (networkData) {
+            result.docker_networks.push({
+              name: networkName,
+              driver: parts[1] || '',
+              scope: parts[2] || '',
+              subnet: networkData.IPAM?.Config?.[0]?.Subnet,
+              gateway: networkData.IPAM?.Config?.[0]?.Gateway,
+              containers: Object.keys(networkData.Containers || {}).length,
+              created: networkData.Created,
+            });
+          } else {
+            result.docker_networks.push({
+              name: networkName,
+              driver: parts[1] || '',
+              scope: parts[2] || '',
+              containers: 0,
+            });
           }
         }
 
@@ -169,50 +183,59 @@ export const networkCommand = new Command('network')
         const containersResult = await ssh.executeCommand(
           'docker ps --format "{{.ID}}\t{{.Names}}"'
         );
-        const containerLines = containersResult.stdout.trim().split('\n');
-
-        for (const line of containerLines) {
-          if (!line) continue;
-
-          const parts = line.split('\t');
-          if (parts.length >= 2 && parts[0] && parts[1]) {
-            const containerId = parts[0];
-            const containerName = parts[1];
-
-            try {
-              const inspectResult = await ssh.executeCommand(`docker inspect ${containerId}`);
-              const containerData = JSON.parse(inspectResult.stdout)[0];
-
-              const networkMode = containerData.HostConfig?.NetworkMode || 'default';
-              const networks = containerData.NetworkSettings?.Networks || {};
-              const networkNames = Object.keys(networks);
-              const firstNetworkKey = networkNames[0];
-              const firstNetwork = firstNetworkKey ? networks[firstNetworkKey] : undefined;
-
-              // 端口映射
-              const ports: string[] = [];
-              const portBindings = containerData.HostConfig?.PortBindings || {};
-              for (const [containerPort, hostBindings] of Object.entries(portBindings)) {
-                if (Array.isArray(hostBindings)) {
-                  for (const binding of hostBindings as any[]) {
-                    const hostPort = binding.HostPort;
-                    ports.push(`${hostPort}→${containerPort}`);
-                  }
-                }
-              }
+        const containerRows = containersResult.stdout
+          .trim()
+          .split('\n')
+          .filter(line => line)
+          .map(line => line.split('\t'))
+          .filter(parts => parts.length >= 2 && parts[0] && parts[1]);
+
+        // 一次 docker inspect 取回所有容器详情，按短 ID 索引
+        // （期间退出的容器不会出现在结果中，不能按位置对应）
+        const containerDetails = new Map<string, any>();
+        if (containerRows.length > 0) {
+          try {
+            const ids = containerRows.map(parts => parts[0]).join(' ');
+            const inspectResult = await ssh.executeCommand(`docker inspect ${ids}`);
+            for (const containerData of JSON.parse(inspectResult.stdout)) {
+              containerDetails.set(String(containerData.Id).substring(0, 12), containerData);
+            }
+          } catch (error) {
+            // 容器网络信息获取失败，跳过
+          }
+        }
 
-              result.container_networks.push({
-                container_id: containerId,
-                container_name: containerName,
-                network_mode: networkMode,
-                ipv4_address: firstNetwork?.IPAddress,
-                mac_address: firstNetwork?.MacAddress,
-                ports,
-              });
-            } catch (error) {
-              // 容器网络信息获取失败，跳过
+        for (const parts of containerRows) {
+          const containerId = parts[0] || '';
+          const containerData = containerDetails.get(containerId.substring(0, 12));
+          if (!containerData) continue;
+
+          const networkMode = containerData.HostConfig?.NetworkMode || 'default';
+          const networks = containerData.NetworkSettings?.Networks || {};
+          const networkNames = Object.keys(networks);
+          const firstNetworkKey = networkNames[0];
+          const firstNetwork = firstNetworkKey ? networks[firstNetworkKey] : undefined;
+
+          // 端口映射
+          const ports: string[] = [];
+          const portBindings = containerData.HostConfig?.PortBindings || {};
+          for (const [containerPort, hostBindings] of Object.entries(portBindings)) {
+            if (Array.isArray(hostBindings)) {
+              for (const binding of hostBindings as any[]) {
+                const hostPort = binding.HostPort;
+                ports.push(`${hostPort}→${containerPort}`);
+              }
             }
           }
+
+          result.container_networks.push({
+            container_id: containerId,
+            container_name: parts[1] || '',
+            network_mode: networkMode,
+            ipv4_address: firstNetwork?.IPAddress,
+            mac_address: firstNetwork?.MacAddress,
+            ports,
+          });
         }
       } catch (error: any) {
         throw new Error(`获取网络信息失败: ${error.message}`);
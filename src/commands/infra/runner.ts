@@ -37,6 +37,10 @@ interface RunnerInfo {
   logs: string[];
 }
 
+// systemctl show 输出中关心的属性（值可能包含 '='，取整行剩余部分）
+const SYSTEMCTL_PROPERTY_PATTERN =
+  /^(LoadState|ActiveState|SubState|MainPID|ActiveEnterTimestamp)=(.+)$/gm;
+
 export const runnerCommand = new Command('runner')
   .description('查看 GitHub Actions Runner 状态')
   .option('--env <env>', '环境 (production/stage/development)')
@@ -78,11 +82,9 @@ export const runnerCommand = new Command('runner')
         // 获取服务状态
         try {
           const statusResult = await ssh.executeCommand(`systemctl show ${runnerServiceName} --no-pager`);
-          const statusLines = statusResult.stdout.trim().split('\n');
-
-          for (const line of statusLines) {
-            const [key, value] = line.split('=');
-            if (!value) continue;
+          // 单次正则扫描只取需要的属性，无需逐行拆分数百个属性
+          for (const [, key, value] of statusResult.stdout.matchAll(SYSTEMCTL_PROPERTY_PATTERN)) {
+            if (!key || !value) continue;
 
             switch (key) {
               case 'LoadState':
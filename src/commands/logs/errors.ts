@@ -37,6 +37,90 @@ interface ErrorsResult {
   aggregation?: ErrorAggregation[];
 }
 
+// ============== 日志行解析模式（模块加载时编译一次） ==============
+
+const LINE_NUMBER_PATTERN = /^(\d+)[:-](.*)$/;
+const TIMESTAMP_PATTERN = /(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})/;
+const LEVEL_PATTERN = /\b(ERROR|CRITICAL|WARNING|FATAL|WARN)\b/i;
+
+// 聚合时用于去除动态内容的模式
+const TIMESTAMP_NORMALIZE_PATTERN = /\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}(\.\d+)?/g;
+const UUID_NORMALIZE_PATTERN = /\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b/gi;
+const NUMBER_NORMALIZE_PATTERN = /\b\d+\b/g;
+
+/**
+ * 各错误级别对应的 grep 搜索模式
+ */
+const LEVEL_PATTERNS = {
+  error: 'ERROR|Error|error|FATAL|Fatal|fatal',
+  critical: 'CRITICAL|Critical|critical|FATAL|Fatal|fatal',
+  warning: 'WARNING|Warning|warning|WARN|Warn|warn',
+};
+
+/**
+ * 单个 SSH 连接上同时执行的 grep 数量上限（sshd 默认 MaxSessions 为 10）
+ */
+const MAX_CONCURRENT_GREPS = 5;
+
+/**
+ * 在单个服务容器日志中搜索错误
+ */
+async function searchServiceErrors(
+  ssh: SSHClient,
+  env: Environment,
+  service: string,
+  since: string,
+  searchPattern: string,
+  level: string
+): Promise<ErrorLog[]> {
+  const errors: ErrorLog[] = [];
+  const containerName = env === 'production'
+    ? `optima-${service}-prod`
+    : env === 'stage'
+    ? `optima-${service}-stage`
+    : `optima-${service}-dev`;
+
+  // 搜索错误日志
+  const grepCommand = `docker logs ${containerName} --since ${since} 2>&1 | grep -i -n -E "${searchPattern}"`;
+
+  try {
+    const searchResult = await ssh.executeCommand(grepCommand);
+
+    if (searchResult.stdout.trim()) {
+      const lines = searchResult.stdout.trim().split('\n');
+
+      for (const line of lines) {
+        // 尝试解析行号
+        const lineMatch = line.match(LINE_NUMBER_PATTERN);
+        if (lineMatch && lineMatch[1] && lineMatch[2]) {
+          // 尝试提取时间戳和级别
+          const logLine = lineMatch[2];
+          const timestampMatch = logLine.match(TIMESTAMP_PATTERN);
+          const levelMatch = logLine.match(LEVEL_PATTERN);
+
+          errors.push({
+            service,
+            line_number: parseInt(lineMatch[1]),
+            timestamp: timestampMatch && timestampMatch[1] ? timestampMatch[1] : undefined,
+            level: levelMatch && levelMatch[1] ? levelMatch[1].toUpperCase() : level.toUpperCase(),
+            message: logLine,
+          });
+        } else {
+          errors.push({
+            service,
+            level: level.toUpperCase(),
+            message: line,
+          });
+        }
+      }
+    }
+  } catch (error: any) {
+    // 没有匹配或容器不存在，继续
+  }
+
+  return errors;
+}
+
 export const errorsCommand = new Command('errors')
   .description('查看容器错误日志并聚合分析')
   .option('--service <service>', '指定服务名称')
@@ -78,61 +162,19 @@ export const errorsCommand = new Command('errors')
       try {
         const services = targetService ? [targetService] : Array.from(envConfig.services);
 
-        // 根据级别构建搜索模式
-        const levelPatterns: Record<string, string> = {
-          error: 'ERROR|Error|error|FATAL|Fatal|fatal',
-          critical: 'CRITICAL|Critical|critical|FATAL|Fatal|fatal',
-          warning: 'WARNING|Warning|warning|WARN|Warn|warn',
-        };
-
-        const searchPattern = levelPatterns[options.level] || levelPatterns.error;
-
-        for (const service of services) {
-          const containerName = env === 'production'
-            ? `optima-${service}-prod`
-            : env === 'stage'
-            ? `optima-${service}-stage`
-            : `optima-${service}-dev`;
-
-          // 搜索错误日志
-          const grepCommand = `docker logs ${containerName} --since ${options.since} 2>&1 | grep -i -n -E "${searchPattern}"`;
-
-          try {
-            const searchResult = await ssh.executeCommand(grepCommand);
-
-            if (searchResult.stdout.trim()) {
-              const lines = searchResult.stdout.trim().split('\n');
-
-              for (const line of lines) {
-                // 尝试解析行号
-                const lineMatch = line.match(/^(\d+)[:-](.*)$/);
-                if (lineMatch && lineMatch[1] && lineMatch[2]) {
-                  // 尝试提取时间戳和级别
-                  const logLine = lineMatch[2];
-                  const timestampMatch = logLine.match(/(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})/);
-                  const levelMatch = logLine.match(/\b(ERROR|CRITICAL|WARNING|FATAL|WARN)\b/i);
-
-                  result.errors.push({
-                    service,
-                    line_number: parseInt(lineMatch[1]),
-                    timestamp: timestampMatch && timestampMatch[1] ? timestampMatch[1] : undefined,
-                    level: levelMatch && levelMatch[1] ? levelMatch[1].toUpperCase() : options.level.toUpperCase(),
-                    message: logLine,
-                  });
-                } else {
-                  result.errors.push({
-                    service,
-                    level: options.level.toUpperCase(),
-                    message: line,
-                  });
-                }
-              }
-            }
-          } catch (error: any) {
-            // 没有匹配或容器不存在，继续
-            if (!error.message.includes('No such container')) {
-              // 忽略 grep 没有匹配的情况
-            }
+        // 根据级别选择搜索模式
+        const searchPattern =
+          LEVEL_PATTERNS[options.level as keyof typeof LEVEL_PATTERNS] || LEVEL_PATTERNS.error;
+
+        // 每个服务的 grep 在同一 SSH 连接上开独立 channel 并发执行，
+        // 分批以不超过 sshd 的 MaxSessions 限制；结果按服务顺序合并
+        for (let i = 0; i < services.length; i += MAX_CONCURRENT_GREPS) {
+          const batch = services.slice(i, i + MAX_CONCURRENT_GREPS);
+          const batchErrors = await Promise.all(
+            batch.map(service => searchServiceErrors(ssh, env, service, options.since, searchPattern, options.level))
+          );
+          for (const errors of batchErrors) {
+            result.errors.push(...errors);
           }
         }
 
@@ -145,9 +187,9 @@ export const errorsCommand = new Command('errors')
           for (const error of result.errors) {
             // 提取错误消息的关键部分（去除动态内容如时间、ID等）
             const normalizedMessage = error.message
-              .replace(/\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}(\.\d+)?/g, '<TIMESTAMP>')
-              .replace(/\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b/gi, '<UUID>')
-              .replace(/\b\d+\b/g, '<NUM>')
+              .replace(TIMESTAMP_NORMALIZE_PATTERN, '<TIMESTAMP>')
+              .replace(UUID_NORMALIZE_PATTERN, '<UUID>')
+              .replace(NUMBER_NORMALIZE_PATTERN, '<NUM>')
               .substring(0, 200);
 
             const existing = aggregationMap.get(normalizedMessage);
@@ -21,6 +21,11 @@ interface ExportResult {
   since?: string;
 }
 
+// ============== 日志行解析模式（模块加载时编译一次） ==============
+
+const TIMESTAMP_PATTERN = /(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})/;
+const LEVEL_PATTERN = /\b(ERROR|CRITICAL|WARNING|WARN|INFO|DEBUG)\b/i;
+
 export const exportCommand = new Command('export')
   .description('导出容器日志到本地文件')
   .argument('[service]', '服务名称')
@@ -103,13 +108,14 @@ export const exportCommand = new Command('export')
         const logLines = logsResult.stdout.trim().split('\n');
         result.lines_exported = logLines.length;
 
-        // 根据格式写入文件
+        // 根据格式在内存中组装完整内容，一次写入
+        let content: string;
         if (options.format === 'json') {
           // JSON 格式：每行日志作为一个对象
           const jsonLogs = logLines.map((line, index) => {
             // 尝试解析时间戳和级别
-            const timestampMatch = line.match(/(\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2})/);
-            const levelMatch = line.match(/\b(ERROR|CRITICAL|WARNING|WARN|INFO|DEBUG)\b/i);
+            const timestampMatch = line.match(TIMESTAMP_PATTERN);
+            const levelMatch = line.match(LEVEL_PATTERN);
 
             return {
               line_number: index + 1,
@@ -119,7 +125,7 @@ export const exportCommand = new Command('export')
             };
           });
 
-          const jsonContent = JSON.stringify({
+          content = JSON.stringify({
             service: targetService,
             environment: env,
             exported_at: new Date().toISOString(),
@@ -127,8 +133,6 @@ export const exportCommand = new Command('export')
             total_lines: jsonLogs.length,
             logs: jsonLogs,
           }, null, 2);
-
-          await fs.writeFile(outputFile, jsonContent, 'utf-8');
         } else {
           // Text 格式：原始日志
           const header = [
@@ -142,15 +146,17 @@ export const exportCommand = new Command('export')
             '',
           ].join('\n');
 
-          await fs.writeFile(outputFile, header + logsResult.stdout, 'utf-8');
+          content = header + logsResult.stdout;
         }
 
-        // 获取文件大小
-        const stats = await fs.stat(outputFile);
-        const fileSizeKB = (stats.size / 1024).toFixed(2);
-        const fileSizeMB = (stats.size / 1024 / 1024).toFixed(2);
+        await fs.writeFile(outputFile, content, 'utf-8');
+
+        // 文件大小即写入内容的字节数，无需再 stat
+        const fileSize = Buffer.byteLength(content, 'utf-8');
+        const fileSizeKB = (fileSize / 1024).toFixed(2);
+        const fileSizeMB = (fileSize / 1024 / 1024).toFixed(2);
 
-        if (stats.size < 1024 * 1024) {
+        if (fileSize < 1024 * 1024) {
           result.file_size = `${fileSizeKB} KB`;
         } else {
           result.file_size = `${fileSizeMB} MB`;
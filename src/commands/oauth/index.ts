@@ -11,6 +11,7 @@ import {
   getAdminCredentials,
   setAdminCredentials,
   cacheToken,
+  getCachedToken,
   getAuthConfigPath,
   clearTokenCache,
 } from '../../utils/auth-config.js';
@@ -36,6 +37,55 @@ function getAuthBaseUrl(env: string): string {
   throw new Error(`环境 ${env} 不支持 OAuth 管理`);
 }
 
+type AdminEnvironment = 'ecs-prod' | 'ecs-stage' | 'ec2-prod';
+
+interface TokenResponse {
+  access_token: string;
+  expires_in?: number;
+  token_type?: string;
+}
+
+/**
+ * 使用管理员凭证登录（OAuth password grant），并缓存 token
+ */
+async function requestAdminToken(env: string, baseUrl: string): Promise<TokenResponse> {
+  const credentials = getAdminCredentials(env as AdminEnvironment);
+
+  const response = await axios.post(
+    `${baseUrl}/api/v1/oauth/token`,
+    new URLSearchParams({
+      grant_type: 'password',
+      username: credentials.email,
+      password: credentials.password,
+      client_id: 'admin-panel',
+    }),
+    {
+      timeout: 10000,
+      headers: {
+        'Content-Type': 'application/x-www-form-urlencoded',
+      },
+    }
+  );
+
+  const data = response.data as TokenResponse;
+  cacheToken(env, data.access_token, data.expires_in || 3600);
+  return data;
+}
+
+/**
+ * 获取管理员 token
+ *
+ * 优先使用本地缓存（临近过期时 getCachedToken 返回 null），否则重新登录并缓存
+ */
+async function getAdminToken(env: string, baseUrl: string): Promise<string> {
+  const cached = getCachedToken(env);
+  if (cached) {
+    return cached;
+  }
+  const { access_token } = await requestAdminToken(env, baseUrl);
+  return access_token;
+}
+
 // ============== oauth login ==============
 
 const loginCommand = new Command('login')
@@ -48,7 +98,7 @@ const loginCommand = new Command('login')
       const baseUrl = getAuthBaseUrl(env);
 
       // 获取保存的凭证
-      const credentials = getAdminCredentials(env as 'ecs-prod' | 'ecs-stage' | 'ec2-prod');
+      const credentials = getAdminCredentials(env as AdminEnvironment);
 
       if (!isJsonOutput()) {
         console.log(chalk.bold(`\n登录 ${env}`));
@@ -57,27 +107,8 @@ const loginCommand = new Command('login')
         console.log(chalk.gray('正在登录...'));
       }
 
-      // 使用 OAuth password grant
-      const response = await axios.post(
-        `${baseUrl}/api/v1/oauth/token`,
-        new URLSearchParams({
-          grant_type: 'password',
-          username: credentials.email,
-          password: credentials.password,
-          client_id: 'admin-panel',
-        }),
-        {
-          timeout: 10000,
-          headers: {
-            'Content-Type': 'application/x-www-form-urlencoded',
-          },
-        }
-      );
-
-      const { access_token, expires_in, token_type } = response.data;
-
-      // 缓存 token
-      cacheToken(env, access_token, expires_in || 3600);
+      // 使用 OAuth password grant（登录后自动缓存 token）
+      const { expires_in, token_type } = await requestAdminToken(env, baseUrl);
 
       if (isJsonOutput()) {
         outputSuccess({
@@ -116,8 +147,10 @@ const listCommand = new Command('list')
       const env = resolveEnvironment(options.env);
       const baseUrl = getAuthBaseUrl(env);
 
+      const token = await getAdminToken(env, baseUrl);
       const response = await axios.get(`${baseUrl}/api/v1/oauth/clients`, {
         timeout: 10000,
+        headers: { Authorization: `Bearer ${token}` },
       });
 
       const clients = response.data.clients || response.data || [];
@@ -161,7 +194,7 @@ const listCommand = new Command('list')
     } catch (error: any) {
       if (error.response?.status === 401 || error.response?.status === 403) {
         console.log(chalk.yellow('需要管理员认证才能访问 OAuth 客户端列表'));
-        console.log(chalk.gray('请使用 --token 参数提供访问令牌'));
+        console.log(chalk.gray('请检查管理员凭证 (oauth set-credentials) 后重新执行 oauth login'));
       } else {
         handleError(error);
       }
@@ -180,9 +213,13 @@ const getCommand = new Command('get')
       const env = resolveEnvironment(options.env);
       const baseUrl = getAuthBaseUrl(env);
 
+      const token = await getAdminToken(env, baseUrl);
       const response = await axios.get(
         `${baseUrl}/api/v1/oauth/clients/${clientId}`,
-        { timeout: 10000 }
+        {
+          timeout: 10000,
+          headers: { Authorization: `Bearer ${token}` },
+        }
       );
 
       const client = response.data;
@@ -340,7 +377,7 @@ const setCredentialsCommand = new Command('set-credentials')
   .requiredOption('--password <password>', '管理员密码')
   .action(async (options) => {
     try {
-      const env = options.env as 'ecs-prod' | 'ecs-stage' | 'ec2-prod';
+      const env = options.env as AdminEnvironment;
       if (!['ecs-prod', 'ecs-stage', 'ec2-prod'].includes(env)) {
         console.log(chalk.red(`无效环境: ${env}`));
         console.log(chalk.gray('支持的环境: ecs-prod, ecs-stage, ec2-prod'));
@@ -377,7 +414,7 @@ const showConfigCommand = new Command('show-config')
       console.log();
 
       const envs = options.env
-        ? [options.env as 'ecs-prod' | 'ecs-stage' | 'ec2-prod']
+        ? [options.env as AdminEnvironment]
         : (['ecs-prod', 'ecs-stage', 'ec2-prod'] as const);
 
       for (const env of envs) {
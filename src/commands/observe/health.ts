@@ -17,6 +17,8 @@ import {
   getServiceForEnvironment,
   getServicesByTypeV2,
   getEnvironmentConfig,
+  ServiceConfigV2,
+  TargetEnvironment,
 } from '../../utils/config.js';
 import {
   isJsonOutput,
@@ -75,10 +77,8 @@ export const healthCommand = new Command('health')
       }
       // 按类型过滤
       else if (options.type && options.type !== 'all') {
-        const typeServices = getServicesByTypeV2(options.type);
-        targetServices = targetServices.filter(s =>
-          typeServices.some(ts => ts.name === s.name)
-        );
+        const typeServiceNames = new Set(getServicesByTypeV2(options.type).map(ts => ts.name));
+        targetServices = targetServices.filter(s => typeServiceNames.has(s.name));
       }
 
       if (!isJsonOutput()) {
@@ -87,98 +87,46 @@ export const healthCommand = new Command('health')
         console.log(chalk.gray(`检查 optima-core 增强端点\n`));
       }
 
-      const results: ServiceHealthResult[] = [];
-
-      // 检查每个服务
-      for (const serviceConfig of targetServices) {
-        const envServiceConfig = serviceConfig.environments[env];
-        if (!envServiceConfig) continue;
-
-        const service = serviceConfig.name;
-        const baseUrl = envServiceConfig.healthEndpoint.replace('/health', '');
-        const healthUrl = `${baseUrl}/health`;
+      // 各服务健康检查互不依赖，同时发起；再按服务顺序逐个等待，结果就绪即输出
+      const checkedServices = targetServices.filter(s => s.environments[env]);
+      const pendingChecks = checkedServices.map(serviceConfig =>
+        checkEnhancedHealth(serviceConfig, env)
+      );
 
+      const results: ServiceHealthResult[] = [];
+      for (const [i, pendingCheck] of pendingChecks.entries()) {
         if (!isJsonOutput()) {
+          const service = checkedServices[i]?.name || '';
           process.stdout.write(chalk.white(`检查 ${service.padEnd(20)}... `));
         }
 
-        const startTime = Date.now();
-        try {
-          const response = await axios.get<HealthCheckResult>(healthUrl, {
-            timeout: 10000,
-            validateStatus: () => true,
-          });
-
-          const responseTime = Date.now() - startTime;
-          const isHealthy = response.status === 200;
-          const data = response.data;
-
-          // 判断是否是增强的健康检查（有 checks 字段）
-          const isEnhanced = data && typeof data === 'object' && 'checks' in data;
-
-          const result: ServiceHealthResult = {
-            service,
-            type: serviceConfig.type,
-            url: healthUrl,
-            status: isHealthy ? 'healthy' : 'unhealthy',
-            http_status: response.status,
-            response_time: `${responseTime}ms`,
-          };
-
-          if (isEnhanced) {
-            result.version = data.version;
-            result.git_commit = data.git_commit;
-            result.git_branch = data.git_branch;
-            result.checks = data.checks;
-          } else {
-            result.status = isHealthy ? 'legacy' : 'unhealthy';
-          }
+        const result = await pendingCheck;
+        results.push(result);
 
-          results.push(result);
-
-          if (!isJsonOutput()) {
-            if (isHealthy) {
-              if (isEnhanced) {
-                const commit = data.git_commit ? data.git_commit.substring(0, 7) : 'unknown';
-                const checksStatus = data.checks
-                  ? Object.entries(data.checks)
-                      .map(([k, v]) => `${k}:${v.status === 'healthy' ? '✓' : '✗'}`)
-                      .join(' ')
-                  : '';
-                console.log(
-                  chalk.green(`✓ 健康`) +
-                  chalk.gray(` (${responseTime}ms) `) +
-                  chalk.cyan(`v${data.version || '?'} `) +
-                  chalk.yellow(`@${commit} `) +
-                  chalk.gray(checksStatus)
-                );
-              } else {
-                console.log(
-                  chalk.yellow(`✓ 旧版`) +
-                  chalk.gray(` (${responseTime}ms) - 未集成 optima-core`)
-                );
-              }
-            } else {
-              console.log(chalk.red(`✗ 不健康 (HTTP ${response.status})`));
-            }
-          }
-        } catch (error: any) {
-          const responseTime = Date.now() - startTime;
-          const errorMsg = error.code === 'ECONNREFUSED' ? '连接被拒绝' :
-                          error.code === 'ETIMEDOUT' ? '连接超时' :
-                          error.message;
-
-          results.push({
-            service,
-            type: serviceConfig.type,
-            url: healthUrl,
-            status: 'error',
-            response_time: `${responseTime}ms`,
-            error: errorMsg,
-          });
-
-          if (!isJsonOutput()) {
-            console.log(chalk.red(`✗ 错误: ${errorMsg}`));
+        if (!isJsonOutput()) {
+          if (result.status === 'healthy') {
+            const commit = result.git_commit ? result.git_commit.substring(0, 7) : 'unknown';
+            const checksStatus = result.checks
+              ? Object.entries(result.checks)
+                  .map(([k, v]) => `${k}:${v.status === 'healthy' ? '✓' : '✗'}`)
+                  .join(' ')
+              : '';
+            console.log(
+              chalk.green(`✓ 健康`) +
+              chalk.gray(` (${result.response_time}) `) +
+              chalk.cyan(`v${result.version || '?'} `) +
+              chalk.yellow(`@${commit} `) +
+              chalk.gray(checksStatus)
+            );
+          } else if (result.status === 'legacy') {
+            console.log(
+              chalk.yellow(`✓ 旧版`) +
+              chalk.gray(` (${result.response_time}) - 未集成 optima-core`)
+            );
+          } else if (result.status === 'unhealthy') {
+            console.log(chalk.red(`✗ 不健康 (HTTP ${result.http_status})`));
+          } else {
+            console.log(chalk.red(`✗ 错误: ${result.error}`));
           }
         }
       }
@@ -216,3 +164,64 @@ export const healthCommand = new Command('health')
       handleError(error);
     }
   });
+
+/**
+ * 检查单个服务的增强健康端点
+ */
+async function checkEnhancedHealth(
+  serviceConfig: ServiceConfigV2,
+  env: TargetEnvironment
+): Promise<ServiceHealthResult> {
+  const service = serviceConfig.name;
+  const baseUrl = (serviceConfig.environments[env]?.healthEndpoint || '').replace('/health', '');
+  const healthUrl = `${baseUrl}/health`;
+
+  const startTime = Date.now();
+  try {
+    const response = await axios.get<HealthCheckResult>(healthUrl, {
+      timeout: 10000,
+      validateStatus: () => true,
+    });
+
+    const responseTime = Date.now() - startTime;
+    const isHealthy = response.status === 200;
+    const data = response.data;
+
+    // 判断是否是增强的健康检查（有 checks 字段）
+    const isEnhanced = data && typeof data === 'object' && 'checks' in data;
+
+    const result: ServiceHealthResult = {
+      service,
+      type: serviceConfig.type,
+      url: healthUrl,
+      status: isHealthy ? 'healthy' : 'unhealthy',
+      http_status: response.status,
+      response_time: `${responseTime}ms`,
+    };
+
+    if (isEnhanced) {
+      result.version = data.version;
+      result.git_commit = data.git_commit;
+      result.git_branch = data.git_branch;
+      result.checks = data.checks;
+    } else {
+      result.status = isHealthy ? 'legacy' : 'unhealthy';
+    }
+
+    return result;
+  } catch (error: any) {
+    const responseTime = Date.now() - startTime;
+    const errorMsg = error.code === 'ECONNREFUSED' ? '连接被拒绝' :
+                    error.code === 'ETIMEDOUT' ? '连接超时' :
+                    error.message;
+
+    return {
+      service,
+      type: serviceConfig.type,
+      url: healthUrl,
+      status: 'error',
+      response_time: `${responseTime}ms`,
+      error: errorMsg,
+    };
+  }
+}
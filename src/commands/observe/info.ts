@@ -78,10 +78,8 @@ export const infoCommand = new Command('info')
       }
       // 按类型过滤
       else if (options.type && options.type !== 'all') {
-        const typeServices = getServicesByTypeV2(options.type);
-        targetServices = targetServices.filter(s =>
-          typeServices.some(ts => ts.name === s.name)
-        );
+        const typeServiceNames = new Set(getServicesByTypeV2(options.type).map(ts => ts.name));
+        targetServices = targetServices.filter(s => typeServiceNames.has(s.name));
       }
 
       if (!isJsonOutput()) {
@@ -7,6 +7,8 @@ import {
   getServiceForEnvironment,
   getServicesByTypeV2,
   getEnvironmentConfig,
+  ServiceConfigV2,
+  TargetEnvironment,
 } from '../../utils/config.js';
 import { SSHClient } from '../../utils/ssh.js';
 import {
@@ -40,10 +42,8 @@ export const healthCommand = new Command('health')
       }
       // 按类型过滤
       else if (options.type && options.type !== 'all') {
-        const typeServices = getServicesByTypeV2(options.type);
-        targetServices = targetServices.filter(s =>
-          typeServices.some(ts => ts.name === s.name)
-        );
+        const typeServiceNames = new Set(getServicesByTypeV2(options.type).map(ts => ts.name));
+        targetServices = targetServices.filter(s => typeServiceNames.has(s.name));
       }
 
       if (!isJsonOutput()) {
@@ -51,102 +51,61 @@ export const healthCommand = new Command('health')
         console.log(chalk.gray(`域名: ${envConfig.domain}\n`));
       }
 
-      const results: any[] = [];
-
-      // 检查每个服务
-      for (const serviceConfig of targetServices) {
-        const envServiceConfig = serviceConfig.environments[env];
-        if (!envServiceConfig) continue;
+      // EC2 环境的容器状态查询与 HTTP 检查互不依赖，提前发起，与健康检查并行
+      const checkContainers = envConfig.type === 'ec2' && Boolean(envConfig.host);
+      const containersPromise = checkContainers
+        ? fetchContainersByName(env).catch((error: any) => error as Error)
+        : null;
 
-        const service = serviceConfig.name;
-        const healthUrl = envServiceConfig.healthEndpoint;
+      // 各服务健康检查互不依赖，同时发起；再按服务顺序逐个等待，结果就绪即输出
+      const checkedServices = targetServices.filter(s => s.environments[env]);
+      const pendingChecks = checkedServices.map(serviceConfig =>
+        checkServiceHealth(serviceConfig, env)
+      );
 
+      const results: any[] = [];
+      for (const [i, pendingCheck] of pendingChecks.entries()) {
         if (!isJsonOutput()) {
+          const service = checkedServices[i]?.name || '';
           process.stdout.write(chalk.white(`检查 ${service.padEnd(20)}... `));
         }
 
-        const startTime = Date.now();
-        try {
-          const response = await axios.get(healthUrl, {
-            timeout: 10000,
-            validateStatus: () => true,
-          });
-
-          const responseTime = Date.now() - startTime;
-          const isHealthy = response.status === 200 || response.status === 204;
-
-          results.push({
-            service,
-            type: serviceConfig.type,
-            url: healthUrl,
-            status: isHealthy ? 'healthy' : 'unhealthy',
-            http_status: response.status,
-            response_time: `${responseTime}ms`,
-          });
-
-          if (!isJsonOutput()) {
-            if (isHealthy) {
-              console.log(chalk.green(`✓ 健康`) + chalk.gray(` (${responseTime}ms)`));
-            } else {
-              console.log(chalk.red(`✗ 不健康 (HTTP ${response.status})`));
-            }
-          }
-        } catch (error: any) {
-          const responseTime = Date.now() - startTime;
-          const errorMsg = error.code === 'ECONNREFUSED' ? '连接被拒绝' :
-                          error.code === 'ETIMEDOUT' ? '连接超时' :
-                          error.message;
-
-          results.push({
-            service,
-            type: serviceConfig.type,
-            url: healthUrl,
-            status: 'error',
-            response_time: `${responseTime}ms`,
-            error: errorMsg,
-          });
+        const result = await pendingCheck;
+        results.push(result);
 
-          if (!isJsonOutput()) {
-            console.log(chalk.red(`✗ 错误: ${errorMsg}`));
+        if (!isJsonOutput()) {
+          if (result.status === 'healthy') {
+            console.log(chalk.green(`✓ 健康`) + chalk.gray(` (${result.response_time})`));
+          } else if (result.status === 'unhealthy') {
+            console.log(chalk.red(`✗ 不健康 (HTTP ${result.http_status})`));
+          } else {
+            console.log(chalk.red(`✗ 错误: ${result.error}`));
           }
         }
       }
 
       // EC2 环境：检查容器状态
-      if (envConfig.type === 'ec2' && envConfig.host) {
+      if (containersPromise) {
         if (!isJsonOutput()) {
           console.log(chalk.white('\n检查容器状态...'));
         }
 
-        try {
-          // 映射新环境名到旧 SSH 环境名
-          const sshEnvMap: Record<string, string> = {
-            'ec2-prod': 'production',
-            'bi-data': 'bi-data',
-          };
-          const sshEnv = sshEnvMap[env] || env;
-          const ssh = new SSHClient(sshEnv as any);
-          await ssh.connect();
-
-          const containerResult = await ssh.getContainerStatus();
-          const containers = parseContainerStatus(containerResult.stdout);
-
+        const containersByName = await containersPromise;
+        if (containersByName instanceof Error) {
+          if (!isJsonOutput()) {
+            console.log(chalk.yellow(`  ⚠ 无法获取容器状态: ${containersByName.message}`));
+          }
+        } else {
           results.forEach(result => {
-            const containerName = `optima-${result.service}-prod`;
-            const container = containers.find(c => c.name === containerName);
+            const container = containersByName.get(`optima-${result.service}-prod`);
             if (container) {
               result.container_status = container.status;
             }
           });
 
-          ssh.disconnect();
           if (!isJsonOutput()) {
             console.log(chalk.green('  ✓ 容器状态已获取'));
           }
-        } catch (error: any) {
-          if (!isJsonOutput()) {
-            console.log(chalk.yellow(`  ⚠ 无法获取容器状态: ${error.message}`));
-          }
         }
       }
 
@@ -188,6 +147,75 @@ export const healthCommand = new Command('health')
     }
   });
 
+/**
+ * 检查单个服务的 HTTP 健康端点
+ */
+async function checkServiceHealth(
+  serviceConfig: ServiceConfigV2,
+  env: TargetEnvironment
+): Promise<any> {
+  const service = serviceConfig.name;
+  const healthUrl = serviceConfig.environments[env]?.healthEndpoint || '';
+
+  const startTime = Date.now();
+  try {
+    const response = await axios.get(healthUrl, {
+      timeout: 10000,
+      validateStatus: () => true,
+    });
+
+    const responseTime = Date.now() - startTime;
+    const isHealthy = response.status === 200 || response.status === 204;
+
+    return {
+      service,
+      type: serviceConfig.type,
+      url: healthUrl,
+      status: isHealthy ? 'healthy' : 'unhealthy',
+      http_status: response.status,
+      response_time: `${responseTime}ms`,
+    };
+  } catch (error: any) {
+    const responseTime = Date.now() - startTime;
+    const errorMsg = error.code === 'ECONNREFUSED' ? '连接被拒绝' :
+                    error.code === 'ETIMEDOUT' ? '连接超时' :
+                    error.message;
+
+    return {
+      service,
+      type: serviceConfig.type,
+      url: healthUrl,
+      status: 'error',
+      response_time: `${responseTime}ms`,
+      error: errorMsg,
+    };
+  }
+}
+
+/**
+ * 通过 SSH 获取 EC2 环境的容器状态，按容器名索引
+ */
+async function fetchContainersByName(
+  env: TargetEnvironment
+): Promise<Map<string, { id: string; name: string; status: string; ports: string }>> {
+  // 映射新环境名到旧 SSH 环境名
+  const sshEnvMap: Record<string, string> = {
+    'ec2-prod': 'production',
+    'bi-data': 'bi-data',
+  };
+  const sshEnv = sshEnvMap[env] || env;
+  const ssh = new SSHClient(sshEnv as any);
+  await ssh.connect();
+
+  try {
+    const containerResult = await ssh.getContainerStatus();
+    const containers = parseContainerStatus(containerResult.stdout);
+    return new Map(containers.map(c => [c.name, c]));
+  } finally {
+    ssh.disconnect();
+  }
+}
+
 /**
  * 解析容器状态输出
  */
@@ -124,12 +124,12 @@ export const inspectCommand = new Command('inspect')
           console.log(chalk.cyan('\n环境变量:'));
           const envVars = inspectData.Config.Env;
           if (envVars && envVars.length > 0) {
-            const displayed = envVars
-              .slice(0, 10)
-              .map((v: string) => maskSensitive(v));
-            for (const envVar of displayed) {
-              const [key, ...valueParts] = envVar.split('=');
-              const value = valueParts.join('=');
+            for (const rawVar of envVars.slice(0, 10) as string[]) {
+              // 只在第一个 '=' 处切分，值中的 '=' 原样保留
+              const envVar = maskSensitive(rawVar);
+              const eqIndex = envVar.indexOf('=');
+              const key = eqIndex === -1 ? envVar : envVar.slice(0, eqIndex);
+              const value = eqIndex === -1 ? '' : envVar.slice(eqIndex + 1);
               printKeyValue(key, value || '(空)', 1);
             }
             if (envVars.length > 10) {
@@ -53,6 +53,58 @@ export const statusCommand = new Command('status')
 
         const results: any[] = [];
 
+        // 一次 docker ps 取回所有容器，按名称索引
+        let psError: string | null = null;
+        const containerRows: string[][] = [];
+        try {
+          const statusResult = await ssh.executeCommand(
+            'docker ps -a --format "{{.ID}}\\t{{.Names}}\\t{{.Status}}\\t{{.Image}}\\t{{.Ports}}"'
+          );
+          for (const line of statusResult.stdout.trim().split('\n')) {
+            if (line) containerRows.push(line.split('\t'));
+          }
+        } catch (error: any) {
+          psError = error.message;
+        }
+        const rowsByName = new Map(containerRows.map(row => [row[1] || '', row]));
+
+        // 与原先 --filter "name=..." 一致：优先精确匹配，否则取名称包含该字符串的第一个容器
+        const findContainer = (containerName: string) =>
+          rowsByName.get(containerName) ||
+          containerRows.find(row => (row[1] || '').includes(containerName));
+
+        // 运行中的容器一次 docker stats 取回资源使用
+        const matchedRows = containerNames.map(findContainer);
+        const runningIds: string[] = [];
+        for (const row of matchedRows) {
+          if (row && row[0] && row[2]?.startsWith('Up')) {
+            runningIds.push(row[0]);
+          }
+        }
+        const statsById = new Map<string, { cpu?: string; memory?: string }>();
+        const collectStats = async (ids: string[]): Promise<boolean> => {
+          try {
+            const statsResult = await ssh.executeCommand(
+              `docker stats --no-stream --format "{{.Container}}\\t{{.CPUPerc}}\\t{{.MemUsage}}" ${ids.join(' ')}`,
+              { timeout: 10000 }
+            );
+            // 不论退出码，已返回的行都可用
+            for (const line of statsResult.stdout.trim().split('\n')) {
+              const [statsId, cpuRaw, memRaw] = line.split('\t');
+              if (statsId) statsById.set(statsId, { cpu: cpuRaw, memory: memRaw });
+            }
+            return statsResult.exitCode === 0;
+          } catch (error) {
+            // 忽略统计错误
+            return false;
+          }
+        };
+        if (runningIds.length > 0 && !(await collectStats(runningIds)) && runningIds.length > 1) {
+          // 合并调用失败（如某个容器在 ps 与 stats 之间被删除）时逐个重试缺失的容器，只影响该容器
+          const missingIds = runningIds.filter(id => !statsById.has(id));
+          await Promise.all(missingIds.map(id => collectStats([id])));
+        }
+
         for (let i = 0; i < containerNames.length; i++) {
           const containerName = containerNames[i];
           const serviceConfig = targetServices[i];
@@ -62,80 +114,59 @@ export const statusCommand = new Command('status')
             process.stdout.write(chalk.white(`检查 ${service}... `));
           }
 
-          try {
-            // 获取容器详细状态
-            const statusResult = await ssh.executeCommand(
-              `docker ps -a --filter "name=${containerName}" --format "{{.ID}}\\t{{.Names}}\\t{{.Status}}\\t{{.Image}}\\t{{.Ports}}"`
-            );
-
-            if (!statusResult.stdout.trim()) {
-              results.push({
-                service,
-                container_name: containerName,
-                status: 'not_found',
-                message: '容器不存在',
-              });
-
-              if (!isJsonOutput()) {
-                console.log(chalk.red('✗ 容器不存在'));
-              }
-              continue;
-            }
-
-            const [id, name, status, image, ports] = statusResult.stdout.trim().split('\t');
-
-            // 解析状态
-            const isRunning = status ? status.startsWith('Up') : false;
-            const uptime = isRunning && status ? status.replace('Up ', '') : null;
-
-            // 获取资源使用（如果运行中）
-            let cpu = null;
-            let memory = null;
-            if (isRunning) {
-              try {
-                const statsResult = await ssh.executeCommand(
-                  `docker stats --no-stream --format "{{.CPUPerc}}\\t{{.MemUsage}}" ${id}`,
-                  { timeout: 5000 }
-                );
-                if (statsResult.exitCode === 0) {
-                  const [cpuRaw, memRaw] = statsResult.stdout.trim().split('\t');
-                  cpu = cpuRaw;
-                  memory = memRaw;
-                }
-              } catch (error) {
-                // 忽略统计错误
-              }
-            }
-
+          if (psError) {
             results.push({
               service,
-              container_name: name,
-              container_id: id ? id.substring(0, 12) : '',
-              status: isRunning ? 'running' : 'stopped',
-              uptime,
-              image,
-              ports,
-              cpu,
-              memory,
+              container_name: containerName,
+              status: 'error',
+              error: psError,
             });
 
             if (!isJsonOutput()) {
-              if (isRunning) {
-                console.log(chalk.green(`✓ 运行中 (${uptime})`));
-              } else {
-                console.log(chalk.yellow(`⚠ 已停止`));
-              }
+              console.log(chalk.red(`✗ 错误: ${psError}`));
             }
-          } catch (error: any) {
+            continue;
+          }
+
+          const row = matchedRows[i];
+          if (!row) {
             results.push({
               service,
               container_name: containerName,
-              status: 'error',
-              error: error.message,
+              status: 'not_found',
+              message: '容器不存在',
             });
 
             if (!isJsonOutput()) {
-              console.log(chalk.red(`✗ 错误: ${error.message}`));
+              console.log(chalk.red('✗ 容器不存在'));
+            }
+            continue;
+          }
+
+          const [id, name, status, image, ports] = row;
+
+          // 解析状态
+          const isRunning = status ? status.startsWith('Up') : false;
+          const uptime = isRunning && status ? status.replace('Up ', '') : null;
+          const stats = id ? statsById.get(id) : undefined;
+
+          results.push({
+            service,
+            container_name: name,
+            container_id: id ? id.substring(0, 12) : '',
+            status: isRunning ? 'running' : 'stopped',
+            uptime,
+            image,
+            ports,
+            cpu: stats?.cpu ?? null,
+            memory: stats?.memory ?? null,
+          });
+
+          if (!isJsonOutput()) {
+            if (isRunning) {
+              console.log(chalk.green(`✓ 运行中 (${uptime})`));
+            } else {
+              console.log(chalk.yellow(`⚠ 已停止`));
             }
           }
         }
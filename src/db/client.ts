@@ -1,6 +1,7 @@
 import { Client, ClientConfig } from 'pg';
 import { Environment } from '../utils/config.js';
 import { DatabaseError } from '../utils/error.js';
+import { truncate } from '../utils/output.js';
 import { getDatabaseUser } from './password.js';
 import { SSHTunnel } from './tunnel.js';
 
@@ -119,7 +120,7 @@ export class DatabaseClient {
     } catch (error: any) {
       await this.client.query('ROLLBACK').catch(() => {});
       throw new DatabaseError(`查询执行失败: ${error.message}`, {
-        sql: sql.substring(0, 100) + '...',
+        sql: truncate(sql, 100),
         error: error.message,
       });
     }
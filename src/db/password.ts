@@ -138,22 +138,25 @@ export function getRDSInfo(): { host: string; port: number } {
   }
 }
 
+/**
+ * Fallback database → user mapping (legacy)
+ */
+const DEFAULT_DATABASE_USERS: Readonly<Record<string, string>> = {
+  optima_auth: 'auth_user',
+  optima_mcp: 'mcp_user',
+  optima_commerce: 'commerce_user',
+  optima_chat: 'chat_user',
+  optima_stage_auth: 'auth_stage_user',
+  optima_stage_mcp: 'mcp_stage_user',
+  optima_stage_commerce: 'commerce_stage_user',
+  optima_stage_chat: 'chat_stage_user',
+  optima_infisical: 'infisical_user',
+  postgres: 'optima_admin',
+};
+
 /**
  * Fallback user mapping (legacy)
  */
 function getDefaultDatabaseUser(database: string): string {
-  const userMap: Record<string, string> = {
-    optima_auth: 'auth_user',
-    optima_mcp: 'mcp_user',
-    optima_commerce: 'commerce_user',
-    optima_chat: 'chat_user',
-    optima_stage_auth: 'auth_stage_user',
-    optima_stage_mcp: 'mcp_stage_user',
-    optima_stage_commerce: 'commerce_stage_user',
-    optima_stage_chat: 'chat_stage_user',
-    optima_infisical: 'infisical_user',
-    postgres: 'optima_admin',
-  };
-
-  return userMap[database] || 'optima_admin';
+  return DEFAULT_DATABASE_USERS[database] || 'optima_admin';
 }
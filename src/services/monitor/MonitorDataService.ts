@@ -1,4 +1,6 @@
-import axios from 'axios';
+import axios, { AxiosInstance } from 'axios';
+import http from 'http';
+import https from 'https';
 import { Client as SSH2Client } from 'ssh2';
 import fs from 'fs';
 import { getAllServices } from '../../utils/services-loader.js';
@@ -30,14 +32,22 @@ interface SSHConnection {
 export class MonitorDataService {
   private _environment: string;
   private sshKeyPath: string;
+  private sshPrivateKey: string | null = null;
   private connectionPool: Map<string, SSHConnection>;
   private maxIdleTime: number = 60000; // 60秒后释放空闲连接
+  private httpClient: AxiosInstance;
 
   constructor(environment: string = 'production') {
     this._environment = environment;
     this.sshKeyPath = process.env.OPTIMA_SSH_KEY || `${process.env.HOME}/.ssh/optima-ec2-key`;
     this.connectionPool = new Map();
 
+    // 健康检查 HTTP 客户端：keep-alive 复用 TCP/TLS 连接，避免每轮刷新都重新握手
+    this.httpClient = axios.create({
+      httpAgent: new http.Agent({ keepAlive: true, maxSockets: 16 }),
+      httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 16 }),
+    });
+
     // 定期清理空闲连接
     setInterval(() => this.cleanupIdleConnections(), 30000);
   }
@@ -73,7 +83,11 @@ export class MonitorDataService {
 
       let privateKey: string;
       try {
-        privateKey = fs.readFileSync(this.sshKeyPath, 'utf8');
+        // 私钥只读一次，后续连接（含重连）复用
+        if (this.sshPrivateKey === null) {
+          this.sshPrivateKey = fs.readFileSync(this.sshKeyPath, 'utf8');
+        }
+        privateKey = this.sshPrivateKey;
       } catch (error: any) {
         reject(new Error(`Failed to read SSH key: ${error.message}`));
         return;
@@ -207,7 +221,7 @@ export class MonitorDataService {
         (async () => {
           try {
             const startTime = Date.now();
-            const response = await axios.get(healthEndpoint, {
+            const response = await this.httpClient.get(healthEndpoint, {
               timeout: 3000,
               maxRedirects: 0,
               validateStatus: () => true,
@@ -10,12 +10,16 @@ import { AWSError } from '../error.js';
 
 // ============== EC2 客户端 ==============
 
+let cachedEC2Client: EC2Client | null = null;
+
 /**
- * 创建 EC2 客户端
+ * 获取 EC2 客户端（进程内共享，复用连接池）
  */
 export function createEC2Client(): EC2Client {
-  const region = getAWSRegion();
-  return new EC2Client({ region });
+  if (!cachedEC2Client) {
+    cachedEC2Client = new EC2Client({ region: getAWSRegion() });
+  }
+  return cachedEC2Client;
 }
 
 /**
@@ -122,17 +126,20 @@ export function getInstanceName(instance: Instance): string | undefined {
   return getInstanceTag(instance, 'Name');
 }
 
+/**
+ * 环境 → EC2 实例 Name 标签
+ */
+const INSTANCE_NAME_BY_ENV: Readonly<Record<string, string>> = {
+  production: 'optima-prod-host',
+  stage: 'optima-stage-host',
+  development: 'optima-dev-host',
+};
+
 /**
  * 通过环境动态查找 EC2 实例 ID
  */
 export async function findEC2InstanceByEnvironment(environment: string): Promise<string | null> {
-  const nameMap: Record<string, string> = {
-    production: 'optima-prod-host',
-    stage: 'optima-stage-host',
-    development: 'optima-dev-host',
-  };
-
-  const instanceName = nameMap[environment];
+  const instanceName = INSTANCE_NAME_BY_ENV[environment];
   if (!instanceName) {
     throw new AWSError(`未知环境: ${environment}`, { environment });
   }
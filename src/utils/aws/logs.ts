@@ -13,12 +13,16 @@ import { AWSError } from '../error.js';
 
 // ============== CloudWatch Logs 客户端 ==============
 
+let cachedCloudWatchLogsClient: CloudWatchLogsClient | null = null;
+
 /**
- * 创建 CloudWatch Logs 客户端
+ * 获取 CloudWatch Logs 客户端（进程内共享，复用连接池）
  */
 export function createLogsClient(): CloudWatchLogsClient {
-  const region = getAWSRegion();
-  return new CloudWatchLogsClient({ region });
+  if (!cachedCloudWatchLogsClient) {
+    cachedCloudWatchLogsClient = new CloudWatchLogsClient({ region: getAWSRegion() });
+  }
+  return cachedCloudWatchLogsClient;
 }
 
 /**
@@ -8,12 +8,16 @@ import { AWSError } from '../error.js';
 
 // ============== RDS 客户端 ==============
 
+let cachedRDSClient: RDSClient | null = null;
+
 /**
- * 创建 RDS 客户端
+ * 获取 RDS 客户端（进程内共享，复用连接池）
  */
 export function createRDSClient(): RDSClient {
-  const region = getAWSRegion();
-  return new RDSClient({ region });
+  if (!cachedRDSClient) {
+    cachedRDSClient = new RDSClient({ region: getAWSRegion() });
+  }
+  return cachedRDSClient;
 }
 
 /**
@@ -1,6 +1,7 @@
 import {
   SSMClient,
   GetParameterCommand,
+  GetParametersCommand,
   GetParametersByPathCommand,
   Parameter,
 } from '@aws-sdk/client-ssm';
@@ -9,12 +10,18 @@ import { AWSError } from '../error.js';
 
 // ============== SSM 客户端 ==============
 
+let cachedSSMClient: SSMClient | null = null;
+
 /**
- * 创建 SSM 客户端
+ * 获取 SSM 客户端
+ *
+ * 进程内共享同一个实例，复用凭证解析结果和 HTTPS 连接池
  */
 export function createSSMClient(): SSMClient {
-  const region = getAWSRegion();
-  return new SSMClient({ region });
+  if (!cachedSSMClient) {
+    cachedSSMClient = new SSMClient({ region: getAWSRegion() });
+  }
+  return cachedSSMClient;
 }
 
 /**
@@ -42,6 +49,46 @@ export async function getParameter(name: string, decrypt = true): Promise<Parame
   }
 }
 
+/**
+ * GetParameters 单次请求最多支持的参数数量
+ */
+const GET_PARAMETERS_BATCH_SIZE = 10;
+
+/**
+ * 批量获取多个参数（返回 参数名 → 值 的映射，不存在的参数不包含在结果中）
+ */
+export async function getParameters(
+  names: string[],
+  decrypt = true
+): Promise<Map<string, string>> {
+  const client = createSSMClient();
+  const values = new Map<string, string>();
+
+  try {
+    for (let i = 0; i < names.length; i += GET_PARAMETERS_BATCH_SIZE) {
+      const command = new GetParametersCommand({
+        Names: names.slice(i, i + GET_PARAMETERS_BATCH_SIZE),
+        WithDecryption: decrypt,
+      });
+
+      const response = await client.send(command);
+
+      for (const param of response.Parameters || []) {
+        if (param.Name && param.Value !== undefined) {
+          values.set(param.Name, param.Value);
+        }
+      }
+    }
+
+    return values;
+  } catch (error: any) {
+    throw new AWSError(
+      `无法批量获取 SSM 参数: ${names.join(', ')}`,
+      { names, error: error.message }
+    );
+  }
+}
+
 /**
  * 获取路径下的所有参数（返回完整的 Parameter 对象数组）
  */
@@ -1,12 +1,8 @@
 import Conf from 'conf';
 import { readFileSync, existsSync } from 'fs';
-import { join, dirname } from 'path';
+import { join } from 'path';
 import { homedir } from 'os';
-import { fileURLToPath } from 'url';
-
-const __dirname = dirname(fileURLToPath(import.meta.url));
-const projectRoot = join(__dirname, '../..');
-const servicesConfigPath = join(projectRoot, 'services-config.json');
+import { readServicesConfigFile } from './services-config-file.js';
 
 // ============== 类型定义 ==============
 
@@ -88,6 +84,21 @@ export const ENV_CONFIG = {
   },
 } as const;
 
+// 可通过 OPTIMA_OPS_ENV 覆盖的旧版环境
+const ENV_OVERRIDE_VALUES: ReadonlySet<string> = new Set<Environment>([
+  'production',
+  'stage',
+  'development',
+]);
+
+// 所有有效的新版目标环境
+const TARGET_ENVIRONMENTS: ReadonlySet<string> = new Set<TargetEnvironment>([
+  'ec2-prod',
+  'ecs-stage',
+  'ecs-prod',
+  'bi-data',
+]);
+
 // ============== 配置实例 ==============
 
 const config = new Conf<ConfigSchema>({
@@ -135,7 +146,7 @@ const config = new Conf<ConfigSchema>({
 export function getCurrentEnvironment(): Environment {
   // 优先从环境变量读取
   const envFromEnv = process.env.OPTIMA_OPS_ENV as Environment;
-  if (envFromEnv && ['production', 'stage', 'development'].includes(envFromEnv)) {
+  if (envFromEnv && ENV_OVERRIDE_VALUES.has(envFromEnv)) {
     return envFromEnv;
   }
 
@@ -187,12 +198,22 @@ export function getSSHKeyPath(env?: Environment): string {
   return ec2Config.keyPath;
 }
 
+/**
+ * 已读取的 SSH 私钥（按路径缓存，同一进程内多次建立连接时不重复读盘）
+ */
+const sshPrivateKeyCache = new Map<string, string>();
+
 /**
  * 读取 SSH 私钥内容
  */
 export function getSSHPrivateKey(env?: Environment): string {
   const keyPath = getSSHKeyPath(env);
 
+  const cached = sshPrivateKeyCache.get(keyPath);
+  if (cached !== undefined) {
+    return cached;
+  }
+
   if (!existsSync(keyPath)) {
     throw new Error(
       `SSH 密钥文件不存在: ${keyPath}\n` +
@@ -202,7 +223,9 @@ export function getSSHPrivateKey(env?: Environment): string {
     );
   }
 
-  return readFileSync(keyPath, 'utf-8');
+  const privateKey = readFileSync(keyPath, 'utf-8');
+  sshPrivateKeyCache.set(keyPath, privateKey);
+  return privateKey;
 }
 
 /**
@@ -239,35 +262,25 @@ interface ServicesConfigFile {
   };
 }
 
-let cachedServicesConfig: ServicesConfigFile | null = null;
-
 /**
  * 加载服务配置文件
  */
 function loadServicesConfig(): ServicesConfigFile {
-  if (cachedServicesConfig) {
-    return cachedServicesConfig;
-  }
-
-  if (!existsSync(servicesConfigPath)) {
-    throw new Error(`服务配置文件不存在: ${servicesConfigPath}`);
-  }
-
-  try {
-    const content = readFileSync(servicesConfigPath, 'utf-8');
-    cachedServicesConfig = JSON.parse(content);
-    return cachedServicesConfig!;
-  } catch (error: any) {
-    throw new Error(`读取服务配置文件失败: ${error.message}`);
-  }
+  return readServicesConfigFile<ServicesConfigFile>();
 }
 
+let cachedAllServices: ServiceConfig[] | null = null;
+
 /**
- * 获取所有服务配置
+ * 获取所有服务配置（配置文件进程内只读，合并结果缓存复用）
  */
 export function getAllServices(): ServiceConfig[] {
+  if (cachedAllServices) {
+    return cachedAllServices;
+  }
   const config = loadServicesConfig();
-  return [...config.services.core, ...config.services.mcp];
+  cachedAllServices = config.services.core.concat(config.services.mcp);
+  return cachedAllServices;
 }
 
 /**
@@ -340,27 +353,11 @@ interface ServicesConfigFileV2 {
   };
 }
 
-let cachedServicesConfigV2: ServicesConfigFileV2 | null = null;
-
 /**
  * 加载新版服务配置文件
  */
 function loadServicesConfigV2(): ServicesConfigFileV2 {
-  if (cachedServicesConfigV2) {
-    return cachedServicesConfigV2;
-  }
-
-  if (!existsSync(servicesConfigPath)) {
-    throw new Error(`服务配置文件不存在: ${servicesConfigPath}`);
-  }
-
-  try {
-    const content = readFileSync(servicesConfigPath, 'utf-8');
-    cachedServicesConfigV2 = JSON.parse(content);
-    return cachedServicesConfigV2!;
-  } catch (error: any) {
-    throw new Error(`读取服务配置文件失败: ${error.message}`);
-  }
+  return readServicesConfigFile<ServicesConfigFileV2>();
 }
 
 /**
@@ -404,19 +401,24 @@ export function setCurrentTargetEnvironment(env: TargetEnvironment): void {
  * 验证环境值是否有效
  */
 export function isValidTargetEnvironment(env: string): env is TargetEnvironment {
-  return ['ec2-prod', 'ecs-stage', 'ecs-prod', 'bi-data'].includes(env);
+  return TARGET_ENVIRONMENTS.has(env);
 }
 
+let cachedAllServicesV2: ServiceConfigV2[] | null = null;
+
 /**
- * 获取所有服务配置 V2
+ * 获取所有服务配置 V2（合并结果缓存复用）
  */
 export function getAllServicesV2(): ServiceConfigV2[] {
+  if (cachedAllServicesV2) {
+    return cachedAllServicesV2;
+  }
   const config = loadServicesConfigV2();
-  return [
-    ...config.services.core,
-    ...config.services.mcp,
-    ...(config.services.bi || []),
-  ];
+  cachedAllServicesV2 = config.services.core.concat(
+    config.services.mcp,
+    config.services.bi || []
+  );
+  return cachedAllServicesV2;
 }
 
 /**
@@ -30,16 +30,26 @@ export interface GitHubJob {
   url: string;
 }
 
+/**
+ * workflow 定义变化很少，交给 gh 的磁盘缓存复用响应，避免每次都访问 GitHub API
+ */
+const WORKFLOWS_API_CACHE_TTL = '1h';
+
+let cachedGHCLICheck: Promise<boolean> | null = null;
+
 /**
  * 检查 GitHub CLI 是否已安装
+ *
+ * 结果在进程内缓存，避免每次 gh 调用都额外启动一次 `gh --version`
  */
-export async function checkGHCLI(): Promise<boolean> {
-  try {
-    await execAsync('gh --version');
-    return true;
-  } catch {
-    return false;
+export function checkGHCLI(): Promise<boolean> {
+  if (!cachedGHCLICheck) {
+    cachedGHCLICheck = execAsync('gh --version').then(
+      () => true,
+      () => false
+    );
   }
+  return cachedGHCLICheck;
 }
 
 /**
@@ -241,18 +251,21 @@ export async function triggerDispatch(
   await executeGH(command);
 }
 
+/**
+ * 服务 → GitHub 仓库名
+ */
+const SERVICE_REPOS: Readonly<Record<string, string>> = {
+  'user-auth': 'Optima-Chat/user-auth',
+  'mcp-host': 'Optima-Chat/mcp-host',
+  'commerce-backend': 'Optima-Chat/commerce-backend',
+  'agentic-chat': 'Optima-Chat/agentic-chat',
+};
+
 /**
  * 获取服务对应的 GitHub 仓库名
  */
 export function getServiceRepo(service: string): string {
-  const repoMap: Record<string, string> = {
-    'user-auth': 'Optima-Chat/user-auth',
-    'mcp-host': 'Optima-Chat/mcp-host',
-    'commerce-backend': 'Optima-Chat/commerce-backend',
-    'agentic-chat': 'Optima-Chat/agentic-chat',
-  };
-
-  return repoMap[service] || `Optima-Chat/${service}`;
+  return SERVICE_REPOS[service] || `Optima-Chat/${service}`;
 }
 
 /**
@@ -261,7 +274,7 @@ export function getServiceRepo(service: string): string {
 export async function getDeployWorkflow(repo: string): Promise<string | null> {
   try {
     const output = await executeGH(
-      `api repos/${repo}/actions/workflows --jq '.workflows[] | select(.path | contains("deploy")) | .path'`
+      `api repos/${repo}/actions/workflows --cache ${WORKFLOWS_API_CACHE_TTL} --jq '.workflows[] | select(.path | contains("deploy")) | .path'`
     );
 
     if (!output || output.trim() === '') {
@@ -274,28 +287,24 @@ export async function getDeployWorkflow(repo: string): Promise<string | null> {
       return null;
     }
 
-    // 优先级排序
+    // 按优先级选出 workflow，未命中时取第一个
     const priority = [
       'deploy-aws-prod.yml',
       'deploy-unified.yml',
       'deploy.yml',
     ];
 
+    let selected = workflows[0];
     for (const preferred of priority) {
       const match = workflows.find(w => w.endsWith(preferred));
       if (match) {
-        const parts = match.split('/');
-        const filename = parts[parts.length - 1];
-        return filename || null;
+        selected = match;
+        break;
       }
     }
 
-    if (workflows[0]) {
-      const parts = workflows[0].split('/');
-      return parts[parts.length - 1] || null;
-    }
-
-    return null;
+    // 路径只在最后处理一次，取出文件名
+    return selected ? selected.slice(selected.lastIndexOf('/') + 1) || null : null;
   } catch (error) {
     return 'deploy-aws-prod.yml';
   }
@@ -19,12 +19,16 @@ const SENSITIVE_KEYS = [
   'auth',
 ];
 
+/**
+ * 由 SENSITIVE_KEYS 预编译的匹配模式（模块加载时构建一次）
+ */
+const SENSITIVE_KEY_PATTERN = new RegExp(SENSITIVE_KEYS.join('|'), 'i');
+
 /**
  * 检查 key 是否包含敏感词
  */
 export function isSensitiveKey(key: string): boolean {
-  const lowerKey = key.toLowerCase();
-  return SENSITIVE_KEYS.some(sensitive => lowerKey.includes(sensitive));
+  return SENSITIVE_KEY_PATTERN.test(key);
 }
 
 /**
@@ -145,18 +149,20 @@ export function maskValue(key: string, value: string): string {
     return value;
   }
 
+  const lowerKey = key.toLowerCase();
+
   // 数据库连接字符串
-  if (key.toLowerCase().includes('database_url') || key.toLowerCase().includes('db_url')) {
+  if (lowerKey.includes('database_url') || lowerKey.includes('db_url')) {
     return maskDatabaseUrl(value);
   }
 
   // AWS 密钥
-  if (key.toLowerCase().includes('aws') && (key.toLowerCase().includes('key') || key.toLowerCase().includes('secret'))) {
+  if (lowerKey.includes('aws') && (lowerKey.includes('key') || lowerKey.includes('secret'))) {
     return maskAwsKey(value);
   }
 
   // JWT Token
-  if (key.toLowerCase().includes('token') && value.startsWith('eyJ')) {
+  if (lowerKey.includes('token') && value.startsWith('eyJ')) {
     return maskJwt(value);
   }
 
@@ -186,29 +186,39 @@ export function formatPercentage(value: number, total: number): string {
   return `${((value / total) * 100).toFixed(1)}%`;
 }
 
+/**
+ * 截断过长文本，超出部分以 "..." 表示
+ */
+export function truncate(text: string, max = 60): string {
+  return text.length <= max ? text : `${text.substring(0, max)}...`;
+}
+
+/**
+ * 状态 → 带颜色的显示文本（模块加载时渲染一次）
+ */
+const STATUS_LABELS: Readonly<Record<string, string>> = {
+  success: chalk.green('✓ 成功'),
+  failure: chalk.red('✗ 失败'),
+  failed: chalk.red('✗ 失败'),
+  completed: chalk.blue('● 完成'),
+  in_progress: chalk.yellow('● 运行中'),
+  queued: chalk.blue('⧗ 队列中'),
+  running: chalk.yellow('● 运行中'),
+  stopped: chalk.gray('○ 停止'),
+  pending: chalk.blue('⧗ 等待中'),
+  healthy: chalk.green('✓ 健康'),
+  unhealthy: chalk.red('✗ 不健康'),
+  cancelled: chalk.gray('○ 已取消'),
+  skipped: chalk.gray('○ 跳过'),
+};
+
 /**
  * 格式化状态（带颜色）
  */
 export function formatStatus(status: string): string {
   if (!status) return 'N/A';
 
-  const statusMap: Record<string, any> = {
-    success: chalk.green('✓ 成功'),
-    failure: chalk.red('✗ 失败'),
-    failed: chalk.red('✗ 失败'),
-    completed: chalk.blue('● 完成'),
-    in_progress: chalk.yellow('● 运行中'),
-    queued: chalk.blue('⧗ 队列中'),
-    running: chalk.yellow('● 运行中'),
-    stopped: chalk.gray('○ 停止'),
-    pending: chalk.blue('⧗ 等待中'),
-    healthy: chalk.green('✓ 健康'),
-    unhealthy: chalk.red('✗ 不健康'),
-    cancelled: chalk.gray('○ 已取消'),
-    skipped: chalk.gray('○ 跳过'),
-  };
-
-  return statusMap[status.toLowerCase()] || status;
+  return STATUS_LABELS[status.toLowerCase()] || status;
 }
 
 /**
@@ -0,0 +1,33 @@
+import { readFileSync, existsSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+const projectRoot = join(__dirname, '../..');
+const servicesConfigPath = join(projectRoot, 'services-config.json');
+
+let cachedServicesConfigFile: unknown = null;
+
+/**
+ * 读取并解析 services-config.json
+ *
+ * 进程内只解析一次，config 与 services-loader 共享同一份结果。
+ * 本模块不依赖 Conf 等有导入副作用的模块，UI 侧可直接引用
+ */
+export function readServicesConfigFile<T>(): T {
+  if (cachedServicesConfigFile) {
+    return cachedServicesConfigFile as T;
+  }
+
+  if (!existsSync(servicesConfigPath)) {
+    throw new Error(`服务配置文件不存在: ${servicesConfigPath}`);
+  }
+
+  try {
+    const content = readFileSync(servicesConfigPath, 'utf-8');
+    cachedServicesConfigFile = JSON.parse(content);
+    return cachedServicesConfigFile as T;
+  } catch (error: any) {
+    throw new Error(`读取服务配置文件失败: ${error.message}`);
+  }
+}
@@ -1,6 +1,4 @@
-import fs from 'fs';
-import path from 'path';
-import { fileURLToPath } from 'url';
+import { readServicesConfigFile } from './services-config-file.js';
 
 interface ServiceConfig {
   name: string;
@@ -20,30 +18,25 @@ interface ServicesConfig {
   };
 }
 
-let cachedConfig: ServicesConfig | null = null;
-
 /**
  * 加载 services-config.json
  */
 export function loadServicesConfig(): ServicesConfig {
-  if (cachedConfig) {
-    return cachedConfig;
-  }
-
-  const __dirname = path.dirname(fileURLToPath(import.meta.url));
-  const configPath = path.join(__dirname, '../../services-config.json');
-  const content = fs.readFileSync(configPath, 'utf-8');
-  cachedConfig = JSON.parse(content) as ServicesConfig;
-
-  return cachedConfig;
+  return readServicesConfigFile<ServicesConfig>();
 }
 
+let cachedAllServices: ServiceConfig[] | null = null;
+
 /**
- * 获取所有服务列表
+ * 获取所有服务列表（合并结果缓存复用）
  */
 export function getAllServices(): ServiceConfig[] {
+  if (cachedAllServices) {
+    return cachedAllServices;
+  }
   const config = loadServicesConfig();
-  return [...config.services.core, ...config.services.mcp];
+  cachedAllServices = config.services.core.concat(config.services.mcp);
+  return cachedAllServices;
 }
 
 /**
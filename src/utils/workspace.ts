@@ -1,6 +1,8 @@
 import { existsSync } from 'fs';
 import { join, dirname } from 'path';
 
+let cachedWorkspaceRoot: string | null | undefined;
+
 /**
  * 获取 Optima Workspace 根目录
  *
@@ -8,9 +10,21 @@ import { join, dirname } from 'path';
  * 1. 环境变量 OPTIMA_WORKSPACE_ROOT
  * 2. 向上遍历目录查找包含 workspace.yaml 的目录
  *
+ * 结果在进程内缓存（包括未找到的情况），避免重复的 existsSync 探测
+ *
  * @returns workspace 根目录路径，未找到返回 null
  */
 export function getWorkspaceRoot(): string | null {
+  if (cachedWorkspaceRoot === undefined) {
+    cachedWorkspaceRoot = findWorkspaceRoot();
+  }
+  return cachedWorkspaceRoot;
+}
+
+/**
+ * 查找 workspace 根目录（未缓存）
+ */
+function findWorkspaceRoot(): string | null {
   // 1. 环境变量优先
   if (process.env.OPTIMA_WORKSPACE_ROOT) {
     const root = process.env.OPTIMA_WORKSPACE_ROOT;
@@ -47,6 +61,23 @@ export function getWorkspaceRoot(): string | null {
   return null;
 }
 
+/**
+ * 服务 → workspace 内相对路径
+ */
+const SERVICE_PATHS: Readonly<Record<string, string>> = {
+  'user-auth': 'core-services/user-auth',
+  'mcp-host': 'core-services/mcp-host',
+  'commerce-backend': 'core-services/commerce-backend',
+  'agentic-chat': 'core-services/agentic-chat',
+  // MCP 工具
+  'comfy-mcp': 'mcp-tools/comfy-mcp',
+  'fetch-mcp': 'mcp-tools/fetch-mcp',
+  'perplexity-mcp': 'mcp-tools/perplexity-mcp',
+  'shopify-mcp': 'mcp-tools/shopify-mcp',
+  'commerce-mcp': 'mcp-tools/commerce-mcp',
+  'google-ads-mcp': 'mcp-tools/google-ads-mcp',
+};
+
 /**
  * 获取服务路径
  *
@@ -59,22 +90,7 @@ export function getServicePath(serviceName: string): string | null {
     return null;
   }
 
-  // 服务路径映射
-  const servicePathMap: Record<string, string> = {
-    'user-auth': 'core-services/user-auth',
-    'mcp-host': 'core-services/mcp-host',
-    'commerce-backend': 'core-services/commerce-backend',
-    'agentic-chat': 'core-services/agentic-chat',
-    // MCP 工具
-    'comfy-mcp': 'mcp-tools/comfy-mcp',
-    'fetch-mcp': 'mcp-tools/fetch-mcp',
-    'perplexity-mcp': 'mcp-tools/perplexity-mcp',
-    'shopify-mcp': 'mcp-tools/shopify-mcp',
-    'commerce-mcp': 'mcp-tools/commerce-mcp',
-    'google-ads-mcp': 'mcp-tools/google-ads-mcp',
-  };
-
-  const relativePath = servicePathMap[serviceName];
+  const relativePath = SERVICE_PATHS[serviceName];
   if (relativePath) {
     const fullPath = join(workspaceRoot, relativePath);
     if (existsSync(fullPath)) {